@@ -3,12 +3,13 @@
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from services.slide_agent import SlideAgent
 from services.structure_agent import generate_outline, edit_outline, outline_to_skeleton
 from services.edit_agent import deck_chat_edit, slide_chat_edit, add_slide
-from utils.state import deck_state, detect_slide_count
+from utils.state import deck_state, detect_slide_count, mark_skeleton_changed, with_deck_lock
 from utils.revision_manager import RevisionManager
 
 
@@ -56,9 +57,82 @@ class AddSlideRequest(BaseModel):
 #  Router
 # ══════════════════════════════════════════════
 
+# Endpoints are async, so blocking LLM work is pushed to the threadpool via run_in_threadpool
+# instead of running on (and stalling) the event loop shared with the Gradio UI. Work that
+# changes deck_state runs under deck_lock, like the Gradio handlers.
 router = APIRouter(prefix="/api")
 
 
+# ── State-Changing Helpers (run in the threadpool) ──
+
+@with_deck_lock
+def _generate_from_template(req: GenerateRequest) -> dict:
+    """Install a template skeleton as the current deck and generate its content."""
+    skeleton: dict = req.template_json
+    agent: SlideAgent = SlideAgent(language="hebrew")
+    rev_manager: RevisionManager = RevisionManager()
+
+    deck_state["skeleton"] = skeleton
+    deck_state["agent"] = agent
+    deck_state["user_prompt"] = req.user_prompt
+    deck_state["document_text"] = req.document_text
+    deck_state["revision_manager"] = rev_manager
+    deck_state["pending_outline"] = None
+
+    agent.generate_all_slides(
+        slides=skeleton["slides"],
+        user_prompt=req.user_prompt,
+        document_text=req.document_text,
+    )
+    mark_skeleton_changed()
+
+    rev_manager.save_revision(
+        skeleton=skeleton, action="יצירה",
+        description="יצירת מצגת ראשונית עם תבנית",
+    )
+    return skeleton
+
+
+@with_deck_lock
+def _propose_outline(req: GenerateRequest, slide_count: Optional[int]) -> dict:
+    """Store the request's sources and generate a pending outline for approval."""
+    deck_state["user_prompt"] = req.user_prompt
+    deck_state["document_text"] = req.document_text
+    outline: dict = generate_outline(req.user_prompt, req.document_text, slide_count)
+    deck_state["pending_outline"] = outline
+    return outline
+
+
+@with_deck_lock
+def _generate_from_outline() -> Optional[dict]:
+    """Turn the pending outline into the current deck and generate it, or return None if there is none."""
+    outline: Optional[dict] = deck_state.get("pending_outline")
+    if outline is None:
+        return None
+
+    skeleton: dict = outline_to_skeleton(outline)
+    agent: SlideAgent = SlideAgent(language="hebrew")
+    rev_manager: RevisionManager = RevisionManager()
+
+    deck_state["skeleton"] = skeleton
+    deck_state["agent"] = agent
+    deck_state["revision_manager"] = rev_manager
+    deck_state["pending_outline"] = None
+
+    agent.generate_all_slides(
+        slides=skeleton["slides"],
+        user_prompt=deck_state.get("user_prompt", ""),
+        document_text=deck_state.get("document_text", ""),
+    )
+    mark_skeleton_changed()
+
+    rev_manager.save_revision(
+        skeleton=skeleton, action="יצירה",
+        description="יצירת מצגת ממבנה מותאם",
+    )
+    return skeleton
+
+
 # ── Health ──
 
 @router.get("/health")
@@ -79,37 +153,13 @@ async def api_generate(req: GenerateRequest) -> dict:
         raise HTTPException(status_code=400, detail="יש להזין הנחיית משתמש או לספק תבנית")
 
     if has_template:
-        skeleton: dict = req.template_json
-        agent: SlideAgent = SlideAgent(language="hebrew")
-        rev_manager: RevisionManager = RevisionManager()
-
-        deck_state["skeleton"] = skeleton
-        deck_state["agent"] = agent
-        deck_state["user_prompt"] = req.user_prompt
-        deck_state["document_text"] = req.document_text
-        deck_state["revision_manager"] = rev_manager
-        deck_state["pending_outline"] = None
-
-        agent.generate_all_slides(
-            slides=skeleton["slides"],
-            user_prompt=req.user_prompt,
-            document_text=req.document_text,
-        )
-
-        rev_manager.save_revision(
-            skeleton=skeleton, action="יצירה",
-            description="יצירת מצגת ראשונית עם תבנית",
-        )
+        skeleton: dict = await run_in_threadpool(_generate_from_template, req)
         return {"status": "success", "message": "המצגת נוצרה בהצלחה", "skeleton": skeleton}
 
     slide_count: Optional[int] = detect_slide_count(req.user_prompt) or req.slide_count
 
-    deck_state["user_prompt"] = req.user_prompt
-    deck_state["document_text"] = req.document_text
-
     try:
-        outline: dict = generate_outline(req.user_prompt, req.document_text, slide_count)
-        deck_state["pending_outline"] = outline
+        outline: dict = await run_in_threadpool(_propose_outline, req, slide_count)
         return {
             "status": "pending_approval",
             "message": f"מבנה מוצע עם {len(outline.get('slides', []))} שקפים",
@@ -122,36 +172,16 @@ async def api_generate(req: GenerateRequest) -> dict:
 @router.post("/outline/approve")
 async def api_approve_outline() -> dict:
     """Approve the pending outline and generate the full presentation."""
-    outline: Optional[dict] = deck_state.get("pending_outline")
-    if outline is None:
+    skeleton: Optional[dict] = await run_in_threadpool(_generate_from_outline)
+    if skeleton is None:
         raise HTTPException(status_code=400, detail="אין מבנה מוצע לאישור")
-
-    skeleton: dict = outline_to_skeleton(outline)
-    agent: SlideAgent = SlideAgent(language="hebrew")
-    rev_manager: RevisionManager = RevisionManager()
-
-    deck_state["skeleton"] = skeleton
-    deck_state["agent"] = agent
-    deck_state["revision_manager"] = rev_manager
-    deck_state["pending_outline"] = None
-
-    agent.generate_all_slides(
-        slides=skeleton["slides"],
-        user_prompt=deck_state.get("user_prompt", ""),
-        document_text=deck_state.get("document_text", ""),
-    )
-
-    rev_manager.save_revision(
-        skeleton=skeleton, action="יצירה",
-        description="יצירת מצגת ממבנה מותאם",
-    )
     return {"status": "success", "message": "המצגת נוצרה בהצלחה", "skeleton": skeleton}
 
 
 @router.post("/outline/edit")
 async def api_edit_outline(req: OutlineEditRequest) -> dict:
     """Edit the pending outline before approval."""
-    message, _ = edit_outline(req.edit_instruction)
+    message, _ = await run_in_threadpool(edit_outline, req.edit_instruction)
     outline: Optional[dict] = deck_state.get("pending_outline")
     return {"status": "success", "message": message, "outline": outline}
 
@@ -164,8 +194,8 @@ async def api_deck_edit(req: DeckEditRequest) -> dict:
     if deck_state["skeleton"] is None:
         raise HTTPException(status_code=400, detail="אין מצגת לעריכה")
 
-    chat_history, preview_html, full_json, _ = deck_chat_edit(
-        req.user_message, req.chat_history,
+    chat_history, preview_html, full_json, _ = await run_in_threadpool(
+        deck_chat_edit, req.user_message, req.chat_history,
     )
     return {
         "status": "success",
@@ -181,8 +211,8 @@ async def api_slide_edit(req: SlideEditRequest) -> dict:
         raise HTTPException(status_code=400, detail="אין מצגת לעריכה")
 
     slide_selection: str = f"[שקף {req.slide_num}] "
-    chat_history, preview, _ = slide_chat_edit(
-        req.user_message, slide_selection, req.chat_history,
+    chat_history, preview, _ = await run_in_threadpool(
+        slide_chat_edit, req.user_message, slide_selection, req.chat_history,
     )
     return {
         "status": "success",
@@ -201,8 +231,8 @@ async def api_add_slide(req: AddSlideRequest) -> dict:
         f"[שקף {req.position_slide_num}] " if req.position_slide_num else ""
     )
 
-    status_msg, _, full_json, _ = add_slide(
-        req.instruction, position_selection,
+    status_msg, _, full_json, _ = await run_in_threadpool(
+        add_slide, req.instruction, position_selection,
         req.before_or_after, req.layout,
     )
     return {
@@ -1,20 +1,23 @@
 """Gradio UI for the slide generation tool."""
 
-import json
 import mimetypes
 from typing import Optional
 
 import gradio as gr
+import orjson
 import requests
 
 from config import settings
 from services.slide_agent import SlideAgent
 from services.structure_agent import generate_outline, edit_outline, outline_to_skeleton
 from services.edit_agent import (
-    deck_chat_edit, slide_chat_edit, on_slide_selected,
+    deck_chat_edit_streaming, slide_chat_edit_streaming, on_slide_selected,
     restore_revision, export_json, add_slide,
 )
-from utils.state import deck_state, get_slide_choices, detect_slide_count
+from utils.state import (
+    deck_state, get_slide_choices, detect_slide_count, get_deck_json, with_deck_lock,
+    mark_skeleton_changed,
+)
 from utils.revision_manager import RevisionManager
 from ui.renderers import render_deck_preview, render_outline_html
 from api import router
@@ -57,6 +60,7 @@ def extract_document_text(file) -> str:
 # ══════════════════════════════════════════════
 
 
+@with_deck_lock
 def handle_generate(file, user_prompt, document_text, slide_count_input):
     has_template = file is not None
     has_prompt = bool(user_prompt and user_prompt.strip())
@@ -67,8 +71,12 @@ def handle_generate(file, user_prompt, document_text, slide_count_input):
                 "{}", gr.update(visible=False), "")
 
     if has_template:
-        content = file.read().decode("utf-8") if hasattr(file, "read") else open(file, "r", encoding="utf-8").read()
-        skeleton = json.loads(content)
+        if hasattr(file, "read"):
+            raw = file.read()
+        else:
+            with open(file, "rb") as f:
+                raw = f.read()
+        skeleton = orjson.loads(raw)
 
         agent = SlideAgent(language="hebrew")
         rev_manager = RevisionManager()
@@ -85,10 +93,13 @@ def handle_generate(file, user_prompt, document_text, slide_count_input):
             user_prompt=user_prompt,
             document_text=document_text or "",
         )
+        mark_skeleton_changed()
 
-        rev_manager.save_revision(skeleton=skeleton, action="יצירה", description="יצירת מצגת ראשונית עם תבנית")
+        deck_json = get_deck_json()
+        rev_manager.save_revision(skeleton=skeleton, action="יצירה", description="יצירת מצגת ראשונית עם תבנית",
+                                  snapshot_bytes=deck_json.encode("utf-8"))
         return ("✅ המצגת נוצרה בהצלחה", render_deck_preview(skeleton),
-                json.dumps(skeleton, indent=2, ensure_ascii=False), gr.update(visible=False), "")
+                deck_json, gr.update(visible=False), "")
 
     detected_count = detect_slide_count(user_prompt)
     if detected_count:
@@ -118,6 +129,7 @@ def handle_generate(file, user_prompt, document_text, slide_count_input):
                 "{}", gr.update(visible=False), "")
 
 
+@with_deck_lock
 def approve_outline():
     outline = deck_state.get("pending_outline")
     if outline is None:
@@ -138,10 +150,13 @@ def approve_outline():
         user_prompt=deck_state.get("user_prompt", ""),
         document_text=deck_state.get("document_text", ""),
     )
+    mark_skeleton_changed()
 
-    rev_manager.save_revision(skeleton=skeleton, action="יצירה", description="יצירת מצגת ממבנה מותאם")
+    deck_json = get_deck_json()
+    rev_manager.save_revision(skeleton=skeleton, action="יצירה", description="יצירת מצגת ממבנה מותאם",
+                              snapshot_bytes=deck_json.encode("utf-8"))
     return ("✅ המצגת נוצרה בהצלחה ממבנה מותאם", render_deck_preview(skeleton),
-            json.dumps(skeleton, indent=2, ensure_ascii=False), gr.update(visible=False), "")
+            deck_json, gr.update(visible=False), "")
 
 
 # ══════════════════════════════════════════════
@@ -195,7 +210,10 @@ CSS = """
 
 
 def build_app():
-    with gr.Blocks(title="כלי יצירת מצגות", theme=gr.themes.Soft(), css=CSS) as app:
+    # delete_cache: every hour, drop exported files older than a day from Gradio's cache
+    with gr.Blocks(
+        title="כלי יצירת מצגות", theme=gr.themes.Soft(), css=CSS, delete_cache=(3600, 86400)
+    ) as app:
 
         gr.Markdown("# 📊 כלי יצירת מצגות", elem_classes=["rtl-text"])
 
@@ -298,15 +316,15 @@ def build_app():
         outline_edit_btn.click(fn=edit_outline, inputs=[outline_edit_input], outputs=[outline_edit_status, outline_preview]).then(fn=lambda: "", outputs=[outline_edit_input])
         approve_btn.click(fn=approve_outline, inputs=[], outputs=[generation_status, generation_preview, generation_json, outline_section, outline_preview]).then(fn=lambda: (gr.update(choices=get_slide_choices()), gr.update(choices=get_slide_choices())), outputs=[slide_selector, new_slide_position],)
 
-        deck_send_btn.click(fn=deck_chat_edit, inputs=[deck_chat_input, deck_chatbot], outputs=[deck_chatbot, deck_edit_preview, deck_edit_json, revision_dropdown]).then(fn=lambda: ("", gr.update(choices=get_slide_choices())), outputs=[deck_chat_input, slide_selector]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[slide_revision_dropdown])
-        deck_chat_input.submit(fn=deck_chat_edit, inputs=[deck_chat_input, deck_chatbot], outputs=[deck_chatbot, deck_edit_preview, deck_edit_json, revision_dropdown]).then(fn=lambda: ("", gr.update(choices=get_slide_choices())), outputs=[deck_chat_input, slide_selector]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[slide_revision_dropdown])
+        deck_send_btn.click(fn=deck_chat_edit_streaming, inputs=[deck_chat_input, deck_chatbot], outputs=[deck_chatbot, deck_edit_preview, deck_edit_json, revision_dropdown]).then(fn=lambda: ("", gr.update(choices=get_slide_choices())), outputs=[deck_chat_input, slide_selector]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[slide_revision_dropdown])
+        deck_chat_input.submit(fn=deck_chat_edit_streaming, inputs=[deck_chat_input, deck_chatbot], outputs=[deck_chatbot, deck_edit_preview, deck_edit_json, revision_dropdown]).then(fn=lambda: ("", gr.update(choices=get_slide_choices())), outputs=[deck_chat_input, slide_selector]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[slide_revision_dropdown])
 
         restore_btn.click(fn=restore_revision, inputs=[revision_dropdown], outputs=[restore_status, deck_edit_json])
         export_btn.click(fn=export_json, inputs=[], outputs=[export_file])
 
         slide_selector.change(fn=on_slide_selected, inputs=[slide_selector], outputs=[slide_preview])
-        slide_send_btn.click(fn=slide_chat_edit, inputs=[slide_chat_input, slide_selector, slide_chatbot], outputs=[slide_chatbot, slide_preview, slide_revision_dropdown]).then(fn=lambda: "", outputs=[slide_chat_input]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[revision_dropdown])
-        slide_chat_input.submit(fn=slide_chat_edit, inputs=[slide_chat_input, slide_selector, slide_chatbot], outputs=[slide_chatbot, slide_preview, slide_revision_dropdown]).then(fn=lambda: "", outputs=[slide_chat_input]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[revision_dropdown])
+        slide_send_btn.click(fn=slide_chat_edit_streaming, inputs=[slide_chat_input, slide_selector, slide_chatbot], outputs=[slide_chatbot, slide_preview, slide_revision_dropdown]).then(fn=lambda: "", outputs=[slide_chat_input]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[revision_dropdown])
+        slide_chat_input.submit(fn=slide_chat_edit_streaming, inputs=[slide_chat_input, slide_selector, slide_chatbot], outputs=[slide_chatbot, slide_preview, slide_revision_dropdown]).then(fn=lambda: "", outputs=[slide_chat_input]).then(fn=lambda: gr.update(choices=deck_state["revision_manager"].get_revision_choices()), outputs=[revision_dropdown])
 
         add_slide_btn.click(fn=add_slide, inputs=[new_slide_instruction, new_slide_position, new_slide_placement, new_slide_layout], outputs=[add_slide_status, add_slide_preview, add_slide_json, new_slide_position],).then(fn=lambda: (gr.update(choices=get_slide_choices()), gr.update(choices=get_slide_choices())), outputs=[slide_selector, new_slide_position],)
 
@@ -1,5 +1,7 @@
 from prompts.prompts import (
     build_structure_prompt, build_outline_edit_prompt,
     build_deck_edit_prompt, build_slide_edit_prompt,
+    DECK_EDIT_SYSTEM_PROMPT, SLIDE_EDIT_SYSTEM_PROMPT,
     build_new_slide_prompt, build_infographic_prompt,
+    build_batch_generation_prompt, build_fused_generation_prompt,
 )
\ No newline at end of file
@@ -198,27 +198,20 @@ EDIT_RESPONSE_FORMAT: str = """{{
 - שינוי layout ימחק את התוכן הקיים ויצור אובייקטים חדשים — אין צורך לספק תוכן חדש ב-edits עבור שקף שמשנה layout."""
 
 
-def build_deck_edit_prompt(
-    deck_json: str, user_prompt: str, document_text: str, user_message: str
-) -> str:
-    """Build the prompt for editing the entire deck via natural language."""
-    return f"""אתה עורך מצגות מקצועי. המשתמש מבקש לערוך תוכן במצגת.
+# Edit prompts are split so the long static rubric goes first as a system message.
+# Providers cache identical prompt prefixes, so only the per-request user message varies.
+_EDIT_RESPONSE_EXAMPLE: str = EDIT_RESPONSE_FORMAT.format(slide_num_example=2)
 
-המצגת הנוכחית (JSON):
-{deck_json}
-
-═══ מקורות מידע (מקור האמת) ═══
-
-ההנחיה המקורית של המשתמש:
-{user_prompt}
+_EDIT_STEPS_SECTION: str = f"""עליך:
+1. לזהות אם הבקשה היא שינוי תוכן, שינוי layout, או שניהם.
+2. לקרוא את ה-object_description של האובייקט כדי להבין את הפורמט הנדרש.
+3. לבצע את השינוי המבוקש תוך שמירה על הפורמט.
+4. להחזיר תשובה בפורמט JSON בלבד, ללא טקסט נוסף:
 
-מסמך מקור:
-{document_text or "לא סופק"}
+{_EDIT_RESPONSE_EXAMPLE}"""
 
-בקשת העריכה:
-{user_message}
-
-═══════════════════════════════════
+DECK_EDIT_SYSTEM_PROMPT: str = f"""אתה עורך מצגות מקצועי. המשתמש מבקש לערוך תוכן במצגת.
+המצגת הנוכחית, מקורות המידע ובקשת העריכה מופיעים בהודעת המשתמש.
 
 חשוב — מבנה המצגת:
 - כל שקף מזוהה לפי "slide_num" (מספר שלם: 1, 2, 3...).
@@ -226,18 +219,13 @@ def build_deck_edit_prompt(
 - כל אובייקט בשקף מזוהה לפי:
   - "object_id" — מזהה טכני כמו "Content 1", "Key Statement", "Content Right".
   - "object_name" — שם תיאורי.
+- אובייקט עם "content_preview" במקום "generated_content" מוצג בקיצור בלבד לצורך הקשר — אל תערוך אותו.
 
 {LAYOUT_LIST_SECTION}
 
 {EDIT_RULES_SECTION}
 
-עליך:
-1. לזהות אם הבקשה היא שינוי תוכן, שינוי layout, או שניהם.
-2. לקרוא את ה-object_description של האובייקט כדי להבין את הפורמט הנדרש.
-3. לבצע את השינוי המבוקש תוך שמירה על הפורמט.
-4. להחזיר תשובה בפורמט JSON בלבד, ללא טקסט נוסף:
-
-{EDIT_RESPONSE_FORMAT.format(slide_num_example=2)}
+{_EDIT_STEPS_SECTION}
 
 אם הבקשה היא עריכה כללית ברמת המצגת (למשל: "קצר את התוכן", "הפוך לפורמלי", "הוסף אימוג'ים") — בצע את השינוי על כל האובייקטים הרלוונטיים בכל השקפים. אין צורך לבקש מהמשתמש מספר שקף או שם אובייקט.
 
@@ -249,61 +237,92 @@ def build_deck_edit_prompt(
 }}
 """
 
+SLIDE_EDIT_SYSTEM_PROMPT: str = f"""אתה עורך מצגות מקצועי. המשתמש מבקש לערוך תוכן בשקף ספציפי.
+השקף הנוכחי, מקורות המידע ובקשת העריכה מופיעים בהודעת המשתמש.
 
-def build_slide_edit_prompt(
-    slide_json: str,
-    slide_num: str,
-    slide_layout: str,
-    user_prompt: str,
-    document_text: str,
-    user_message: str,
-    obj_list_str: str,
-) -> str:
-    """Build the prompt for editing a single slide via natural language."""
-    return f"""אתה עורך מצגות מקצועי. המשתמש מבקש לערוך תוכן בשקף ספציפי.
+חשוב — מבנה השקף:
+- מספר השקף וה-layout הנוכחי שלו מופיעים בהודעת המשתמש. השתמש במספר השקף הזה בשדה slide_num.
+- כל אובייקט בשקף מזוהה לפי:
+  - "object_id" — מזהה טכני כמו "Content 1", "Key Statement", "Content Right".
+  - "object_name" — שם תיאורי.
 
-השקף הנוכחי (JSON):
-{slide_json}
+{LAYOUT_LIST_SECTION}
+
+{EDIT_RULES_SECTION}
+
+{_EDIT_STEPS_SECTION}
 
-═══ מקורות מידע (מקור האמת) ═══
+אם לא הצלחת לזהות את האובייקט — החזר:
+{{
+  "edits": [],
+  "layout_changes": [],
+  "summary": "לא הצלחתי לזהות את האובייקט. האובייקטים הקיימים בשקף הם: <רשימת האובייקטים מהודעת המשתמש>"
+}}
+"""
+
+# Session-stable sources come first and the deck and request last, to extend the shared prefix
+_EDIT_SOURCES_SECTION: str = """═══ מקורות מידע (מקור האמת) ═══
 
 ההנחיה המקורית של המשתמש:
 {user_prompt}
 
 מסמך מקור:
-{document_text or "לא סופק"}
+{document_text}
+
+═══════════════════════════════════"""
+
+DECK_EDIT_TEMPLATE: str = _EDIT_SOURCES_SECTION + """
+
+המצגת הנוכחית (JSON):
+{deck_json}
 
 בקשת העריכה:
 {user_message}
+"""
 
-═══════════════════════════════════
+SLIDE_EDIT_TEMPLATE: str = _EDIT_SOURCES_SECTION + """
 
-חשוב — מבנה השקף:
-- השקף הוא שקף מספר {slide_num}.
-- ה-layout הנוכחי של השקף: {slide_layout}
-- כל אובייקט בשקף מזוהה לפי:
-  - "object_id" — מזהה טכני כמו "Content 1", "Key Statement", "Content Right".
-  - "object_name" — שם תיאורי.
+השקף הנוכחי — שקף מספר {slide_num}, layout: {slide_layout} (JSON):
+{slide_json}
 
-{LAYOUT_LIST_SECTION}
+האובייקטים הקיימים בשקף: {obj_list_str}
 
-{EDIT_RULES_SECTION}
+בקשת העריכה:
+{user_message}
+"""
 
-עליך:
-1. לזהות אם הבקשה היא שינוי תוכן, שינוי layout, או שניהם.
-2. לקרוא את ה-object_description של האובייקט כדי להבין את הפורמט הנדרש.
-3. לבצע את השינוי המבוקש תוך שמירה על הפורמט.
-4. להחזיר תשובה בפורמט JSON בלבד, ללא טקסט נוסף:
 
-{EDIT_RESPONSE_FORMAT.format(slide_num_example=slide_num)}
+def build_deck_edit_prompt(
+    deck_json: str, user_prompt: str, document_text: str, user_message: str
+) -> str:
+    """Build the user message for a deck edit; send it with DECK_EDIT_SYSTEM_PROMPT."""
+    return DECK_EDIT_TEMPLATE.format(
+        deck_json=deck_json,
+        user_prompt=user_prompt,
+        document_text=document_text or "לא סופק",
+        user_message=user_message,
+    )
+
 
-אם לא הצלחת לזהות את האובייקט — החזר:
-{{
-  "edits": [],
-  "layout_changes": [],
-  "summary": "לא הצלחתי לזהות את האובייקט. האובייקטים הקיימים בשקף הם: {obj_list_str}"
-}}
-"""
+def build_slide_edit_prompt(
+    slide_json: str,
+    slide_num: str,
+    slide_layout: str,
+    user_prompt: str,
+    document_text: str,
+    user_message: str,
+    obj_list_str: str,
+) -> str:
+    """Build the user message for a single-slide edit; send it with SLIDE_EDIT_SYSTEM_PROMPT."""
+    return SLIDE_EDIT_TEMPLATE.format(
+        slide_json=slide_json,
+        slide_num=slide_num,
+        slide_layout=slide_layout,
+        user_prompt=user_prompt,
+        document_text=document_text or "לא סופק",
+        user_message=user_message,
+        obj_list_str=obj_list_str,
+    )
 
 
 def build_new_slide_prompt(
@@ -494,4 +513,101 @@ def build_infographic_prompt(
 - אם אין מספיק מידע — החזר בדיוק: "לא סופק מספיק מידע להצגת תוכן זה."
 
 החזר רק את ה-JSON:
-"""
\ No newline at end of file
+"""
+
+
+def build_batch_generation_prompt(
+    objects_json: str,
+    user_prompt: str,
+    document_text: str,
+    language_instruction: str,
+    no_info_message: str,
+) -> str:
+    """Build the prompt for drafting content for many slide objects in a single call."""
+    return f"""אתה כותב תוכן עבור מספר שקפים במצגת מקצועית.
+
+המשימה שלך: עבור כל אובייקט ברשימה, חלץ מידע רלוונטי מהמקורות וכתוב אותו בפורמט המתאים לאובייקט.
+
+מקורות המידע:
+---
+הנחיית המשתמש: {user_prompt}
+
+מסמך מקור:
+{document_text or "לא סופק"}
+---
+
+האובייקטים לכתיבה (JSON):
+{objects_json}
+
+{language_instruction}
+
+הנחיות:
+- כתוב תוכן נפרד לכל אובייקט, בהתאם ל-slide_description ול-object_description שלו.
+- מותר לנסח מחדש, לסכם, ולארגן — זו המטרה שלך.
+- אם המקורות לא מכילים מידע רלוונטי לאובייקט, כתוב עבורו בדיוק: "{no_info_message}"
+- אין להמציא תאריכים, שעות, שנים, מספרים, שמות, או נתונים כמותיים שלא מופיעים במפורש במקורות.
+- אל תחזור על אותו תוכן בשקפים שונים.
+- כתוב בעברית תקינה וברורה.
+
+החזר JSON בלבד, ללא טקסט נוסף, עם רשומה אחת לכל אובייקט:
+
+{{
+  "results": [
+    {{
+      "slide_num": 2,
+      "object_id": "Content 1",
+      "content": "התוכן שנכתב עבור האובייקט"
+    }}
+  ]
+}}
+"""
+
+
+def build_fused_generation_prompt(
+    slide_description: str,
+    object_description: str,
+    user_prompt: str,
+    document_text: str,
+    language_instruction: str,
+    validation_feedback: str,
+    no_info_message: str,
+) -> str:
+    """Build a single prompt that writes a slide object's content and self-checks it against the sources."""
+    return f"""אתה כותב תוכן עבור שקף במצגת מקצועית, ולאחר מכן בודק את התוכן שכתבת.
+
+המשימה שלך: חלץ מידע רלוונטי מהמקורות וכתוב אותו בפורמט המתאים לשקף.
+
+מקורות המידע:
+---
+הנחיית המשתמש: {user_prompt}
+
+מסמך מקור:
+{document_text or "לא סופק"}
+---
+
+שקף: {slide_description}
+פורמט נדרש: {object_description}
+
+{language_instruction}
+
+{validation_feedback}
+
+הנחיות כתיבה:
+- חלץ מידע רלוונטי מהמקורות למעלה וארגן אותו לפי הפורמט הנדרש.
+- מותר לנסח מחדש, לסכם, ולארגן — זו המטרה שלך.
+- אם המקורות לא מכילים מידע רלוונטי לשקף הזה, כתוב בדיוק: "{no_info_message}"
+- אין להמציא תאריכים, שעות, שנים, מספרים, שמות, או נתונים כמותיים שלא מופיעים במפורש במקורות.
+- כתוב בעברית תקינה וברורה.
+
+הנחיות בדיקה (לאחר הכתיבה):
+השאלה המרכזית: "האם התוכן סותר את המקורות או מכיל עובדות שלא קיימות בהם?"
+אשר ✅ אם: התוכן מסכם/מנסח מחדש/מארגן מידע מהמקורות, או מסקנות סבירות הנגזרות מהמידע.
+דחה ❌ אם: תאריכים/שנים/שעות/מספרים/שמות שלא מופיעים במפורש במקורות, עובדות ספציפיות שלא במקורות, תוכן ריק, תוכן גנרי לחלוטין, או "{no_info_message}" כשיש מידע רלוונטי.
+
+החזר בדיוק בפורמט הזה — התוכן, שורת מפריד "---", ואז 3 שורות בדיקה:
+<התוכן בלבד>
+---
+VALID: כן/לא
+REASON: סיבה קצרה
+FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר או לתקן. אם אושר — "אין"
+"""
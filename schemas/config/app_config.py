@@ -5,5 +5,8 @@ class AppSettings(BaseModel):
     """General application settings."""
     max_revisions: int = Field(gt=0)
     max_validation_retries: int = Field(ge=0)
+    max_parallel_llm_calls: int = Field(gt=0)
+    fused_validation: bool = False
+    validator_json_mode: bool = False
     language: str
     no_info_message: str
\ No newline at end of file
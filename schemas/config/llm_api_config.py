@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -10,7 +12,8 @@ class ModelConfig(BaseModel):
 
 
 class AgentParams(BaseModel):
-    """Temperature, top_p, and token limit for a single agent role."""
+    """Temperature, top_p, token limit, and optional model override for a single agent role."""
+    model: Optional[str] = None
     temperature: float = Field(ge=0.0, le=2.0)
     top_p: float = Field(ge=0.0, le=1.0)
     max_tokens: int = Field(gt=0)
@@ -1,19 +1,34 @@
 """Edit agent — handles deck-level and slide-level chat edits."""
 
-import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import gradio as gr
+import orjson
 
-from utils.state import deck_state, parse_slide_num_from_selection, get_slide_by_num, get_slide_choices
-from utils.llm import call_llm, parse_llm_json
+from utils.state import (
+    deck_state, parse_slide_num_from_selection, get_slide_by_num, get_slide_choices,
+    get_deck_json, mark_skeleton_changed, get_skeleton_index, install_skeleton, with_deck_lock,
+)
+from utils.llm import call_llm, call_llm_cached, cache_llm_response, parse_llm_json
 from utils.slide_builder import build_base_slide_entry, build_content_objects_for_layout
 from ui.renderers import render_deck_preview, format_slide_preview
-from prompts import build_deck_edit_prompt, build_slide_edit_prompt
+from prompts import (
+    build_deck_edit_prompt, build_slide_edit_prompt, DECK_EDIT_SYSTEM_PROMPT, SLIDE_EDIT_SYSTEM_PROMPT,
+)
 from schemas.layouts import LAYOUT_OBJECT_TEMPLATES
+from config import settings
 
 
+_REV_RE: re.Pattern = re.compile(r"\[גרסה (\d+)\]")
+# "שקף 3", "שקפים 2 ו-3", "slides 2-4", "שקפים 1 עד 3", "slides 1, 2 and 5"
+_SLIDE_REF_RE: re.Pattern = re.compile(
+    r"(?:שקפים|שקף|slides?)\s*(\d+(?:\s*(?:,|ו-?|-|עד|and|to)\s*\d+)*)", re.IGNORECASE,
+)
+_SLIDE_REF_SEP_RE: re.Pattern = re.compile(r"\s*(,|ו-?|-|עד|and|to)\s*", re.IGNORECASE)
+_SLIDE_RANGE_SEPS: frozenset[str] = frozenset({"-", "עד", "to"})
+_CONTENT_PREVIEW_CHARS: int = 80
 
 
 
@@ -76,64 +91,61 @@ def apply_layout_change(slide: dict, new_layout: str) -> bool:
 
 #  Apply Edits to Skeleton
 
-def _apply_layout_changes(edit_data: dict, skeleton: dict, scope_slide_num: Optional[str]) -> int:
-    """Apply layout changes from edit_data to skeleton slides."""
+def _apply_layout_changes(edit_data: dict, scope_slide_num: Optional[str], touched: set[str]) -> int:
+    """Apply layout changes from edit_data to skeleton slides, recording touched slide numbers."""
+    slide_by_num: dict[str, dict] = get_skeleton_index()["slide_by_num"]
     count: int = 0
     for layout_change in edit_data.get("layout_changes", []):
         target_num: str = scope_slide_num or str(layout_change.get("slide_num", ""))
-        new_layout: str = layout_change.get("new_layout", "")
-        for slide in skeleton["slides"]:
-            if str(slide.get("slide_num", "")) == target_num:
-                if apply_layout_change(slide, new_layout):
-                    count += 1
-                break
+        slide: Optional[dict] = slide_by_num.get(target_num)
+        if slide is not None and apply_layout_change(slide, layout_change.get("new_layout", "")):
+            touched.add(target_num)
+            count += 1
     return count
 
 
-def _find_object_in_slide(slide: dict, object_id: str, object_name: str) -> Optional[dict]:
-    """Find a matching object in a slide by id or name."""
-    for obj in slide.get("slide_objects", []):
-        obj_id: str = obj.get("object_id", "")
-        obj_name: str = obj.get("object_name", "")
-        if (object_id and obj_id == object_id) or (object_name and obj_name == object_name):
-            return obj
-    return None
-
-
-def _apply_single_edit(edit: dict, skeleton: dict, scope_slide_num: Optional[str]) -> bool:
-    """Apply a single content edit to the skeleton, return True if matched."""
+def _apply_single_edit(
+    edit: dict, index: dict[str, dict], scope_slide_num: Optional[str]
+) -> Optional[str]:
+    """Apply a single content edit using the skeleton index, return the edited slide_num or None."""
     edit_slide_num: str = scope_slide_num or str(edit.get("slide_num", ""))
     edit_object_id: str = edit.get("object_id", "")
     edit_object_name: str = edit.get("object_name", "")
-    new_content: str = edit.get("new_content", "")
 
-    # Try exact slide match first
-    for slide in skeleton["slides"]:
-        if str(slide.get("slide_num", "")) == edit_slide_num:
-            obj: Optional[dict] = _find_object_in_slide(slide, edit_object_id, edit_object_name)
-            if obj is not None:
-                obj["generated_content"] = new_content
-                obj["validation_status"] = "edited_by_agent"
-                return True
-
-    # Fallback — search all slides by name
-    if edit_object_name:
-        for slide in skeleton["slides"]:
-            for obj in slide.get("slide_objects", []):
-                if obj.get("object_name", "") == edit_object_name:
-                    obj["generated_content"] = new_content
-                    obj["validation_status"] = "edited_by_agent"
-                    return True
-    return False
-
-
-def apply_edits_to_skeleton(edit_data: dict, scope_slide_num: Optional[str] = None) -> int:
-    """Apply all edits (layout changes + content) from LLM response to the skeleton."""
-    skeleton: dict = deck_state["skeleton"]
-    applied: int = _apply_layout_changes(edit_data, skeleton, scope_slide_num)
+    # Exact slide match first, then fall back to a deck-wide name match
+    match: Optional[tuple[str, dict]] = (
+        index["obj_by_slide_id"].get((edit_slide_num, edit_object_id))
+        or index["obj_by_slide_name"].get((edit_slide_num, edit_object_name))
+        or index["obj_by_name"].get(edit_object_name)
+    )
+    if match is None:
+        return None
+
+    slide_num, obj = match
+    obj["generated_content"] = edit.get("new_content", "")
+    obj["validation_status"] = "edited_by_agent"
+    return slide_num
 
+
+def apply_edits_to_skeleton(
+    edit_data: dict, scope_slide_num: Optional[str] = None, touched: Optional[set[str]] = None
+) -> int:
+    """Apply all edits (layout changes + content) from LLM response to the skeleton.
+
+    Slide numbers that were changed are added to touched when it is given.
+    """
+    if touched is None:
+        touched = set()
+    applied: int = _apply_layout_changes(edit_data, scope_slide_num, touched)
+    if applied:
+        # Layout changes replace slide_objects, so the object maps must be rebuilt
+        mark_skeleton_changed(touched)
+
+    index: dict[str, dict] = get_skeleton_index()
     for edit in edit_data.get("edits", []):
-        if _apply_single_edit(edit, skeleton, scope_slide_num):
+        slide_num: Optional[str] = _apply_single_edit(edit, index, scope_slide_num)
+        if slide_num is not None:
+            touched.add(slide_num)
             applied += 1
 
     return applied
@@ -154,18 +166,26 @@ def _build_success_message(summary: str, applied_count: int, rev_id: int) -> str
     return f"✅ {summary} ({applied_count} אובייקטים עודכנו) — גרסה {rev_id}"
 
 
+def _get_existing_ids_text(skeleton: dict) -> str:
+    """Return the deck's object listing, built once per skeleton index."""
+    index: dict = get_skeleton_index()
+    existing_ids: Optional[str] = index.get("existing_ids_text")
+    if existing_ids is None:
+        existing_ids = "\n".join(
+            f"slide_num {s.get('slide_num')}: {o.get('object_id')} ({o.get('object_name')})"
+            for s in skeleton["slides"]
+            for o in s.get("slide_objects", [])
+        )
+        index["existing_ids_text"] = existing_ids
+    return existing_ids
+
+
 def _build_no_changes_deck_message(summary: str, edit_data: dict, skeleton: dict) -> str:
     """Build assistant message when no edits were applied (deck scope)."""
-    raw_edits: str = json.dumps(edit_data.get("edits", []), ensure_ascii=False, indent=2)
-    existing_ids: list[str] = []
-    for s in skeleton["slides"]:
-        for o in s.get("slide_objects", []):
-            existing_ids.append(
-                f"slide_num {s.get('slide_num')}: {o.get('object_id')} ({o.get('object_name')})"
-            )
+    raw_edits: str = orjson.dumps(edit_data.get("edits", []), option=orjson.OPT_INDENT_2).decode()
     return (
         f"⚠️ {summary}\n\nהסוכן החזיר:\n{raw_edits}\n\n"
-        f"אובייקטים קיימים במצגת:\n" + "\n".join(existing_ids)
+        f"אובייקטים קיימים במצגת:\n{_get_existing_ids_text(skeleton)}"
     )
 
 
@@ -178,47 +198,142 @@ def _build_no_changes_slide_message(summary: str, slide: dict, slide_num: str) -
     return f"⚠️ {summary}\n\nאובייקטים בשקף {slide_num}:\n" + "\n".join(obj_list)
 
 
-def _regenerate_pending_objects(skeleton: dict) -> None:
-    """Scan skeleton for pending_regeneration objects and regenerate them."""
+def _regenerate_pending_objects(
+    skeleton: dict, touched: set[str], max_workers: Optional[int] = None
+) -> None:
+    """Regenerate pending_regeneration objects in parallel, adding their slide numbers to touched.
+
+    Slides are recorded before regeneration starts, so they count as touched even if it fails partway.
+    """
     agent = deck_state.get("agent")
     if agent is None:
         return
     user_prompt = deck_state.get("user_prompt", "")
     document_text = deck_state.get("document_text", "")
-    for slide in skeleton.get("slides", []):
-        has_pending = any(
+    pending_slides: list[dict] = [
+        slide for slide in skeleton.get("slides", [])
+        if any(
             obj.get("validation_status") == "pending_regeneration"
             for obj in slide.get("slide_objects", [])
         )
-        if has_pending:
-            agent.regenerate_pending_objects(slide, user_prompt, document_text)
+    ]
+    if not pending_slides:
+        return
+    touched.update(str(slide.get("slide_num", "")) for slide in pending_slides)
+    max_workers = max_workers or settings.settings.max_parallel_llm_calls
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending_slides))) as executor:
+        list(executor.map(
+            lambda slide: agent.regenerate_pending_objects(slide, user_prompt, document_text),
+            pending_slides,
+        ))
 
 
 
 #  Deck-Level Chat Edit
 
+def _expand_slide_ref(ref: str, slide_count: int) -> set[str]:
+    """Expand a matched list/range of slide numbers ("2 ו-3", "2-4", "1 עד 3") into single numbers."""
+    parts: list[str] = _SLIDE_REF_SEP_RE.split(ref)
+    numbers: set[str] = {parts[0]}
+    for i in range(1, len(parts), 2):
+        sep, prev, num = parts[i], int(parts[i - 1]), int(parts[i + 1])
+        if sep.lower() in _SLIDE_RANGE_SEPS and 0 <= num - prev <= slide_count:
+            numbers.update(str(n) for n in range(prev, num + 1))
+        else:
+            numbers.add(str(num))
+    return numbers
+
+
+def _find_referenced_slides(skeleton: dict, user_message: str) -> set[str]:
+    """Return slide numbers the user message points at, by slide number or object name."""
+    referenced: set[str] = set()
+    for ref in _SLIDE_REF_RE.findall(user_message):
+        referenced.update(_expand_slide_ref(ref, len(skeleton["slides"])))
+    for slide in skeleton["slides"]:
+        for obj in slide.get("slide_objects", []):
+            obj_name: str = obj.get("object_name", "")
+            if obj_name and obj_name in user_message:
+                referenced.add(str(slide.get("slide_num", "")))
+    return referenced
+
+
+def _project_slide(slide: dict, full_content: bool = True) -> dict:
+    """Return the fields of a slide the edit LLM needs, dropping validation bookkeeping.
+
+    With full_content=False, objects carry only a short content preview.
+    """
+    objects: list[dict] = []
+    for obj in slide.get("slide_objects", []):
+        content: str = obj.get("generated_content", "")
+        entry: dict = {
+            "object_id": obj.get("object_id", ""),
+            "object_name": obj.get("object_name", ""),
+            "object_description": obj.get("object_description", ""),
+        }
+        if full_content:
+            entry["generated_content"] = content
+        else:
+            entry["content_preview"] = content[:_CONTENT_PREVIEW_CHARS]
+        objects.append(entry)
+    return {
+        "slide_num": slide.get("slide_num"),
+        "slide_description": slide.get("slide_description", ""),
+        "slide_layout": slide.get("slide_layout", ""),
+        "slide_objects": objects,
+    }
+
+
+def _build_deck_edit_json(skeleton: dict, user_message: str) -> str:
+    """Serialize a compact view of the deck for the edit prompt.
+
+    When the message targets specific slides, the other slides carry only a short
+    content preview.
+    """
+    referenced: set[str] = _find_referenced_slides(skeleton, user_message)
+    slides: list[dict] = [
+        _project_slide(slide, not referenced or str(slide.get("slide_num")) in referenced)
+        for slide in skeleton["slides"]
+    ]
+    return orjson.dumps({"slides": slides}).decode()
+
+
 def _execute_deck_edit(user_message: str, skeleton: dict) -> tuple[str, int, dict]:
     """Call LLM to edit the deck and apply changes. Returns (message, applied_count, edit_data)."""
-    deck_json: str = json.dumps(skeleton, indent=2, ensure_ascii=False)
+    deck_json: str = _build_deck_edit_json(skeleton, user_message)
     edit_prompt: str = build_deck_edit_prompt(
         deck_json, deck_state.get("user_prompt", ""),
         deck_state.get("document_text", "לא סופק"), user_message,
     )
-    raw_response: str = call_llm(edit_prompt, role="edit")
+    raw_response: str = call_llm_cached(
+        edit_prompt, role="edit", system_prompt=DECK_EDIT_SYSTEM_PROMPT, store=False,
+    )
     edit_data: dict = parse_llm_json(raw_response)
-    applied_count: int = apply_edits_to_skeleton(edit_data)
-    _regenerate_pending_objects(skeleton)
+    touched: set[str] = set()
+    try:
+        applied_count: int = apply_edits_to_skeleton(edit_data, touched=touched)
+        if applied_count > 0:
+            # Only replay responses that worked; a failed one should be re-requested on retry
+            cache_llm_response(edit_prompt, raw_response, role="edit", system_prompt=DECK_EDIT_SYSTEM_PROMPT)
+        _regenerate_pending_objects(skeleton, touched)
+    finally:
+        # Edits applied before a failure still changed the skeleton
+        if touched:
+            mark_skeleton_changed(touched)
     return edit_data.get("summary", ""), applied_count, edit_data
 
 
+@with_deck_lock
 def deck_chat_edit(user_message: str, chat_history: list[dict]) -> tuple:
     """Process a deck-level natural-language edit request via chat."""
+    if not user_message or not user_message.strip():
+        return chat_history or [], gr.update(), gr.update(), gr.update()
+
     if deck_state["skeleton"] is None:
         history = _no_deck_response(user_message, chat_history)
         return (
             history,
             '<div class="preview-empty">התצוגה תתעדכן לאחר עריכה</div>',
-            json.dumps({}, indent=2, ensure_ascii=False),
+            "{}",
             gr.update(choices=[]),
         )
 
@@ -226,21 +341,39 @@ def deck_chat_edit(user_message: str, chat_history: list[dict]) -> tuple:
     rev_manager = deck_state["revision_manager"]
     chat_history = chat_history or []
     chat_history.append({"role": "user", "content": user_message})
+    chat_history.append({"role": "assistant", "content": _run_deck_edit(user_message, skeleton)})
 
+    full_json: str = get_deck_json()
+    preview_html: str = render_deck_preview(skeleton)
+    return chat_history, preview_html, full_json, gr.update(choices=rev_manager.get_revision_choices())
+
+
+def deck_chat_edit_streaming(user_message: str, chat_history: list[dict]):
+    """Gradio generator handler: show a pending reply right away, then the deck_chat_edit result."""
+    if user_message and user_message.strip() and deck_state["skeleton"] is not None:
+        pending: list[dict] = list(chat_history or []) + [
+            {"role": "user", "content": user_message},
+            {"role": "assistant", "content": "⏳ עורך את המצגת..."},
+        ]
+        yield pending, gr.update(), gr.update(), gr.update()
+    yield deck_chat_edit(user_message, chat_history)
+
+
+def _run_deck_edit(user_message: str, skeleton: dict) -> str:
+    """Run one deck edit, save a revision if anything changed, and return the assistant reply."""
+    rev_manager = deck_state["revision_manager"]
     try:
         summary, applied_count, edit_data = _execute_deck_edit(user_message, skeleton)
         if applied_count > 0:
-            rev_manager.save_revision(skeleton=skeleton, action="עריכה", description=summary)
-            assistant_msg = _build_success_message(summary, applied_count, rev_manager.get_latest_id())
-        else:
-            assistant_msg = _build_no_changes_deck_message(summary, edit_data, skeleton)
-    except (json.JSONDecodeError, KeyError) as e:
-        assistant_msg = f"⚠️ לא הצלחתי לעבד את התשובה. נסה לנסח מחדש את הבקשה.\n\nשגיאה: {str(e)}"
-
-    chat_history.append({"role": "assistant", "content": assistant_msg})
-    full_json: str = json.dumps(skeleton, indent=2, ensure_ascii=False)
-    preview_html: str = render_deck_preview(skeleton)
-    return chat_history, preview_html, full_json, gr.update(choices=rev_manager.get_revision_choices())
+            # The reply needs the deck JSON anyway; snapshot the same serialization
+            rev_manager.save_revision(
+                skeleton=skeleton, action="עריכה", description=summary,
+                snapshot_bytes=get_deck_json().encode("utf-8"),
+            )
+            return _build_success_message(summary, applied_count, rev_manager.get_latest_id())
+        return _build_no_changes_deck_message(summary, edit_data, skeleton)
+    except (orjson.JSONDecodeError, KeyError) as e:
+        return f"⚠️ לא הצלחתי לעבד את התשובה. נסה לנסח מחדש את הבקשה.\n\nשגיאה: {str(e)}"
 
 
 #  Slide-Level Chat Edit
@@ -282,7 +415,7 @@ def _execute_slide_edit(
     user_message: str, slide: dict, slide_num: str
 ) -> tuple[str, int, dict]:
     """Call LLM to edit a single slide and apply changes."""
-    slide_json: str = json.dumps(slide, indent=2, ensure_ascii=False)
+    slide_json: str = orjson.dumps(_project_slide(slide)).decode()
     obj_list_str: str = ", ".join(
         o.get("object_id", "") + " (" + o.get("object_name", "") + ")"
         for o in slide.get("slide_objects", [])
@@ -293,17 +426,30 @@ def _execute_slide_edit(
         deck_state.get("document_text", "לא סופק"),
         user_message, obj_list_str,
     )
-    raw_response: str = call_llm(edit_prompt, role="edit")
+    raw_response: str = call_llm_cached(
+        edit_prompt, role="edit", system_prompt=SLIDE_EDIT_SYSTEM_PROMPT, store=False,
+    )
     edit_data: dict = parse_llm_json(raw_response)
-    applied_count: int = apply_edits_to_skeleton(edit_data, scope_slide_num=slide_num)
-    _regenerate_pending_objects(deck_state["skeleton"])
+    touched: set[str] = set()
+    try:
+        applied_count: int = apply_edits_to_skeleton(edit_data, scope_slide_num=slide_num, touched=touched)
+        if applied_count > 0:
+            cache_llm_response(edit_prompt, raw_response, role="edit", system_prompt=SLIDE_EDIT_SYSTEM_PROMPT)
+        _regenerate_pending_objects(deck_state["skeleton"], touched)
+    finally:
+        if touched:
+            mark_skeleton_changed(touched)
     return edit_data.get("summary", ""), applied_count, edit_data
 
 
+@with_deck_lock
 def slide_chat_edit(
     user_message: str, slide_selection: str, chat_history: list[dict]
 ) -> tuple:
     """Process a slide-level natural-language edit request via chat."""
+    if not user_message or not user_message.strip():
+        return chat_history or [], gr.update(), gr.update()
+
     if deck_state["skeleton"] is None:
         history = _no_deck_response(user_message, chat_history)
         return history, "בחר שקף כדי לראות את התוכן שלו", gr.update(choices=[])
@@ -323,11 +469,12 @@ def slide_chat_edit(
         if applied_count > 0:
             rev_manager.save_revision(
                 skeleton=skeleton, action=f"עריכת שקף {slide_num}", description=summary,
+                snapshot_bytes=get_deck_json().encode("utf-8"),
             )
             assistant_msg = _build_success_message(summary, applied_count, rev_manager.get_latest_id())
         else:
             assistant_msg = _build_no_changes_slide_message(summary, slide, slide_num)
-    except (json.JSONDecodeError, KeyError) as e:
+    except (orjson.JSONDecodeError, KeyError) as e:
         assistant_msg = f"⚠️ לא הצלחתי לעבד את התשובה. נסה לנסח מחדש את הבקשה.\n\nשגיאה: {str(e)}"
 
     chat_history.append({"role": "assistant", "content": assistant_msg})
@@ -336,26 +483,38 @@ def slide_chat_edit(
     return chat_history, preview, gr.update(choices=rev_manager.get_revision_choices())
 
 
+def slide_chat_edit_streaming(user_message: str, slide_selection: str, chat_history: list[dict]):
+    """Gradio generator handler: show a pending reply right away, then the slide_chat_edit result."""
+    if user_message and user_message.strip() and slide_selection and deck_state["skeleton"] is not None:
+        pending: list[dict] = list(chat_history or []) + [
+            {"role": "user", "content": user_message},
+            {"role": "assistant", "content": "⏳ עורך את השקף..."},
+        ]
+        yield pending, gr.update(), gr.update()
+    yield slide_chat_edit(user_message, slide_selection, chat_history)
+
+
 #  Revision Management
 
+@with_deck_lock
 def restore_revision(revision_selection: str) -> tuple[str, str]:
     """Restore the deck to a previously saved revision."""
     if not revision_selection or deck_state["skeleton"] is None:
-        return "❌ יש לבחור גרסה", json.dumps(deck_state.get("skeleton", {}), indent=2, ensure_ascii=False)
+        return "❌ יש לבחור גרסה", get_deck_json()
 
     rev_manager = deck_state["revision_manager"]
-    match: Optional[re.Match] = re.match(r"\[גרסה (\d+)\]", revision_selection)
+    match: Optional[re.Match] = _REV_RE.match(revision_selection)
     if not match:
-        return "❌ לא ניתן לזהות מספר גרסה", json.dumps(deck_state["skeleton"], indent=2, ensure_ascii=False)
+        return "❌ לא ניתן לזהות מספר גרסה", get_deck_json()
 
     revision_id: int = int(match.group(1))
-    restored: Optional[dict] = rev_manager.restore_revision(revision_id)
-    if restored is None:
-        return "❌ גרסה לא נמצאה", json.dumps(deck_state["skeleton"], indent=2, ensure_ascii=False)
+    snapshot_json: Optional[str] = rev_manager.get_snapshot_json(revision_id)
+    if snapshot_json is None:
+        return "❌ גרסה לא נמצאה", get_deck_json()
 
-    deck_state["skeleton"] = restored
-    full_json: str = json.dumps(restored, indent=2, ensure_ascii=False)
-    return f"✅ שוחזר לגרסה {revision_id} — העריכה הבאה תיצור גרסה חדשה", full_json
+    # The snapshot text is the deck JSON of that revision, so it doubles as the JSON cache
+    install_skeleton(orjson.loads(snapshot_json), snapshot_json)
+    return f"✅ שוחזר לגרסה {revision_id} — העריכה הבאה תיצור גרסה חדשה", get_deck_json()
 
 
 def export_json() -> Optional[str]:
@@ -363,8 +522,9 @@ def export_json() -> Optional[str]:
     if deck_state["skeleton"] is None:
         return None
     output_path: str = "presentation_output.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(deck_state["skeleton"], f, indent=2, ensure_ascii=False)
+    # Reuse the cached preview JSON; it is the same OPT_INDENT_2 serialization
+    with open(output_path, "wb") as f:
+        f.write(get_deck_json().encode("utf-8"))
     return output_path
 
 
@@ -388,9 +548,10 @@ def _get_adjacent_slides_json(skeleton: dict, insert_index: int) -> str:
         adjacent.append(slides[insert_index - 1])
     if insert_index < len(slides):
         adjacent.append(slides[insert_index])
-    return json.dumps(adjacent, indent=2, ensure_ascii=False)
+    return orjson.dumps(adjacent, option=orjson.OPT_INDENT_2).decode()
 
 
+@with_deck_lock
 def add_slide(
     instruction: str,
     position_selection: str,
@@ -406,7 +567,7 @@ def add_slide(
     if not instruction or not instruction.strip():
         return ("❌ יש להזין תיאור לשקף החדש",
                 render_deck_preview(),
-                json.dumps(deck_state["skeleton"], indent=2, ensure_ascii=False),
+                get_deck_json(),
                 gr.update(choices=[]))
 
     skeleton = deck_state["skeleton"]
@@ -460,32 +621,37 @@ def add_slide(
 
         # Insert and renumber
         skeleton["slides"].insert(insert_index, new_slide)
-        _renumber_slides(skeleton)
-
-        # Generate content via slide agent
-        agent = deck_state.get("agent")
-        if agent:
-            agent.generate_slide(
-                slide=new_slide,
-                user_prompt=deck_state.get("user_prompt", ""),
-                document_text=deck_state.get("document_text", ""),
-            )
+        try:
+            _renumber_slides(skeleton)
+
+            # Generate content via slide agent
+            agent = deck_state.get("agent")
+            if agent:
+                agent.generate_slide(
+                    slide=new_slide,
+                    user_prompt=deck_state.get("user_prompt", ""),
+                    document_text=deck_state.get("document_text", ""),
+                )
+        finally:
+            # The slide is in the deck even if generation fails
+            mark_skeleton_changed()
 
         rev_manager.save_revision(
             skeleton=skeleton,
             action="הוספת שקף",
             description=f"שקף חדש: {title}",
+            snapshot_bytes=get_deck_json().encode("utf-8"),
         )
 
         return (
             f"✅ שקף '{title}' נוסף בהצלחה — גרסה {rev_manager.get_latest_id()}",
             render_deck_preview(skeleton),
-            json.dumps(skeleton, indent=2, ensure_ascii=False),
+            get_deck_json(),
             gr.update(choices=get_slide_choices(), value=None),
         )
 
-    except (json.JSONDecodeError, KeyError) as e:
+    except (orjson.JSONDecodeError, KeyError) as e:
         return (f"❌ שגיאה ביצירת שקף: {str(e)}",
                 render_deck_preview(skeleton),
-                json.dumps(skeleton, indent=2, ensure_ascii=False),
+                get_deck_json(),
                 gr.update(choices=[]))
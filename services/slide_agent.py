@@ -1,30 +1,60 @@
 """Slide agent — generates and validates slide content via LLM."""
 
-from langchain_core.prompts import PromptTemplate
+import re
+from typing import Optional
+
+import orjson
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from utils.llm import call_llm
+from utils.llm import call_llm, call_llm_cached, cache_llm_response, parse_llm_json
 from config import settings
 
 
+# Output budget for one batched drafting call; bigger batches are split so each call stays under it
+_BATCH_MAX_TOKENS: int = 4000
+
+# Separator line between the content and the VALID/REASON/FEEDBACK block in a fused response
+_FUSED_SEPARATOR_RE: re.Pattern = re.compile(r"^\s*---\s*$", re.MULTILINE)
+
+# One VALID/REASON/FEEDBACK line; the value is whatever follows the first colon, if any
+_VALIDATION_FIELD_RE: re.Pattern = re.compile(
+    r"^[ \t]*(VALID|REASON|FEEDBACK)[^:\n]*(?::(.*))?$", re.IGNORECASE | re.MULTILINE
+)
+_VALID_TRUE_VALUES: tuple[str, ...] = ("כן", "yes", "Yes", "true", "True")
+
+# Object names containing either word are titles; the words are stripped to get the title text
+_TITLE_WORD_RE: re.Pattern = re.compile("כותרת|תת")
+
+# With no document, a user prompt shorter than this can't carry enough facts to fill an object
+_SHORT_PROMPT_CHARS: int = 50
+
+
 #  Validator Agent
 
 class ValidatorAgent:
     """Validates generated slide content against original user inputs."""
 
     def __init__(self) -> None:
-        self.validation_prompt: PromptTemplate = PromptTemplate(
-            input_variables=[
-                "generated_content", "user_prompt", "slide_description",
-                "object_description", "document_text", "no_info_message",
-            ],
-            template="""אתה בודק תוכן מצגות. \
+        no_info_message: str = settings.settings.no_info_message
+        # Static instructions go in the system message so the provider can reuse the cached prefix
+        self.system_prompt: str = f"""אתה בודק תוכן מצגות. \
 תפקידך למנוע הזיות ותוכן בדוי, תוך אישור תוכן לגיטימי.
 
-התוכן שנוצר:
-{generated_content}
+השאלה המרכזית: "האם התוכן סותר את המקורות או מכיל עובדות שלא קיימות בהם?"
+
+אשר ✅ אם: התוכן מסכם/מנסח מחדש/מארגן מידע מהמקורות, או מסקנות סבירות הנגזרות מהמידע.
+דחה ❌ אם: תאריכים/שנים/שעות/מספרים/שמות שלא מופיעים במפורש במקורות, עובדות ספציפיות שלא במקורות, תוכן ריק, תוכן גנרי לחלוטין, או "{no_info_message}" כשיש מידע רלוונטי.
 
-═══ מקורות המידע המותרים ═══
+החזר JSON בלבד, ללא טקסט נוסף, בפורמט הזה:
+{{
+  "valid": true או false,
+  "reason": "סיבה קצרה",
+  "feedback": "אם נדחה — ציין במפורש אילו פרטים להסיר או לתקן (לדוגמה: הסר את התאריך X, הסר את השם Y — אלו לא מופיעים במקורות). אם אושר — מחרוזת ריקה"
+}}
+"""
+        # Per-call fields, filled with str.format: generated_content, user_prompt,
+        # slide_description, object_description, document_text
+        self.validation_prompt: str = """═══ מקורות המידע המותרים ═══
 
 הנחיית המשתמש:
 {user_prompt}
@@ -39,17 +69,9 @@ class ValidatorAgent:
 
 ═══════════════════════════
 
-השאלה המרכזית: "האם התוכן סותר את המקורות או מכיל עובדות שלא קיימות בהם?"
-
-אשר ✅ אם: התוכן מסכם/מנסח מחדש/מארגן מידע מהמקורות, או מסקנות סבירות הנגזרות מהמידע.
-דחה ❌ אם: תאריכים/שנים/שעות/מספרים/שמות שלא מופיעים במפורש במקורות, עובדות ספציפיות שלא במקורות, תוכן ריק, תוכן גנרי לחלוטין, או "{no_info_message}" כשיש מידע רלוונטי.
-
-החזר בדיוק בפורמט הזה (3 שורות):
-VALID: כן/לא
-REASON: סיבה קצרה
-FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר או לתקן (לדוגמה: "הסר את התאריך X, הסר את השם Y — אלו לא מופיעים במקורות"). אם אושר — "אין"
-""",
-        )
+התוכן שנוצר:
+{generated_content}
+"""
 
     def validate(
         self,
@@ -63,6 +85,9 @@ FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר
         empty_check: dict | None = self._check_empty_content(generated_content)
         if empty_check is not None:
             return empty_check
+        no_info_check: dict | None = self._check_no_info_content(generated_content, user_prompt, document_text)
+        if no_info_check is not None:
+            return no_info_check
 
         formatted_prompt: str = self.validation_prompt.format(
             generated_content=generated_content,
@@ -70,11 +95,13 @@ FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר
             slide_description=slide_description,
             object_description=object_description,
             document_text=document_text or "לא סופק",
-            no_info_message=settings.settings.no_info_message,
         )
 
         try:
-            result_text: str = call_llm(formatted_prompt, role="validation")
+            result_text: str = call_llm_cached(
+                formatted_prompt, role="validation", system_prompt=self.system_prompt,
+                json_mode=settings.settings.validator_json_mode,
+            )
             return self._parse_validation_response(result_text)
         except Exception as e:
             return {
@@ -96,8 +123,24 @@ FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר
             }
         return None
 
+    @staticmethod
+    def _check_no_info_content(content: str, user_prompt: str, document_text: str) -> dict | None:
+        """Accept the no-info message without an LLM call when the sources are too thin to contradict it."""
+        if (
+            content.strip() == settings.settings.no_info_message
+            and not (document_text or "").strip()
+            and len(user_prompt.strip()) < _SHORT_PROMPT_CHARS
+        ):
+            return {
+                "is_valid": True,
+                "reason": "אין מקורות מספיקים — הודעת חוסר מידע תקינה",
+                "feedback": "",
+                "raw_response": "[PRE-CHECK: no-info message accepted without sources]",
+            }
+        return None
+
     def _parse_validation_response(self, response_text: str) -> dict:
-        """Parse the 3-line VALID/REASON/FEEDBACK format from the validator LLM."""
+        """Parse the validator's JSON verdict, falling back to the 3-line VALID/REASON/FEEDBACK format."""
         result: dict = {
             "is_valid": False,
             "reason": "",
@@ -111,6 +154,9 @@ FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר
             return result
 
         try:
+            json_result: dict | None = self._extract_fields_from_json(response_text, result)
+            if json_result is not None:
+                return json_result
             text: str = self._strip_markdown_fences(response_text)
             result = self._extract_fields_from_lines(text, result)
         except Exception as e:
@@ -120,36 +166,52 @@ FEEDBACK: אם נדחה — ציין במפורש אילו פרטים להסיר
 
         return result
 
+    @staticmethod
+    def _extract_fields_from_json(text: str, result: dict) -> dict | None:
+        """Parse a {"valid", "reason", "feedback"} JSON verdict into result dict, or None if there is none."""
+        if "{" not in text:
+            return None
+        try:
+            data = parse_llm_json(text)
+        except (orjson.JSONDecodeError, ValueError):
+            return None
+        if not isinstance(data, dict) or "valid" not in data:
+            return None
+
+        valid = data["valid"]
+        result["is_valid"] = valid if isinstance(valid, bool) else any(v in str(valid) for v in _VALID_TRUE_VALUES)
+        reason: str = str(data.get("reason") or "").strip()
+        feedback: str = str(data.get("feedback") or "").strip()
+        result["reason"] = reason or ("תקין" if result["is_valid"] else "לא צוינה סיבה")
+        if feedback != "אין":
+            result["feedback"] = feedback
+        return result
+
     @staticmethod
     def _strip_markdown_fences(text: str) -> str:
         """Remove optional markdown code fences and unescape newlines."""
         text = text.strip()
         if text.startswith("```"):
-            text = "\n".join(text.split("\n")[1:])
+            # Drop the opening fence line (everything, if there is no newline)
+            text = text[text.find("\n") + 1:] if "\n" in text else ""
         if text.endswith("```"):
-            text = "\n".join(text.split("\n")[:-1])
+            text = text[:max(text.rfind("\n"), 0)]
         return text.strip().replace("\\n", "\n")
 
     @staticmethod
     def _extract_fields_from_lines(text: str, result: dict) -> dict:
         """Parse VALID / REASON / FEEDBACK lines into result dict."""
-        for line in text.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            line_upper: str = line.upper()
+        for match in _VALIDATION_FIELD_RE.finditer(text):
+            field: str = match.group(1).upper()
+            value: str = (match.group(2) or "").strip()
 
-            if line_upper.startswith("VALID"):
-                value: str = line.split(":", 1)[-1].strip() if ":" in line else ""
-                result["is_valid"] = any(v in value for v in ("כן", "yes", "Yes", "כן.", "true", "True"))
-            elif line_upper.startswith("REASON"):
-                value = line.split(":", 1)[-1].strip() if ":" in line else ""
+            if field == "VALID":
+                result["is_valid"] = any(v in value for v in _VALID_TRUE_VALUES)
+            elif field == "REASON":
                 if value:
                     result["reason"] = value
-            elif line_upper.startswith("FEEDBACK"):
-                value = line.split(":", 1)[-1].strip() if ":" in line else ""
-                if value and value != "אין":
-                    result["feedback"] = value
+            elif value and value != "אין":
+                result["feedback"] = value
 
         if result["is_valid"] and not result["reason"]:
             result["reason"] = "תקין"
@@ -167,20 +229,32 @@ class SlideAgent:
 
     def __init__(self, language: str = "hebrew", max_retries: int = settings.settings.max_validation_retries) -> None:
         self.language: str = language
+        self.language_instruction: str = (
+            "כתוב בעברית בלבד." if language.lower() == "hebrew"
+            else "Generate output in the same language as the input."
+        )
         self.max_retries: int = max_retries
         self.validator: ValidatorAgent = ValidatorAgent()
 
-        self.prompt_template: PromptTemplate = PromptTemplate(
-            input_variables=[
-                "user_prompt", "slide_description", "object_description",
-                "document_text", "language_instruction", "validation_feedback",
-                "no_info_message",
-            ],
-            template="""אתה כותב תוכן עבור שקף במצגת מקצועית.
+        no_info_message: str = settings.settings.no_info_message
+        # Rules and the per-agent language instruction are fixed, so they form the system prompt
+        self.system_prompt: str = f"""אתה כותב תוכן עבור שקף במצגת מקצועית.
 
 המשימה שלך: חלץ מידע רלוונטי מהמקורות וכתוב אותו בפורמט המתאים לשקף.
 
-מקורות המידע:
+{self.language_instruction}
+
+הנחיות:
+- חלץ מידע רלוונטי מהמקורות וארגן אותו לפי הפורמט הנדרש.
+- מותר לנסח מחדש, לסכם, ולארגן — זו המטרה שלך.
+- אם המקורות לא מכילים מידע רלוונטי לשקף הזה, החזר בדיוק: "{no_info_message}"
+- אין להמציא תאריכים, שעות, שנים, מספרים, שמות, או נתונים כמותיים שלא מופיעים במפורש במקורות.
+- אם אתה מוצא את עצמך כותב פרט ספציפי שלא קיים במקורות — עצור והחזר את הודעת "{no_info_message}"
+- אל תחזיר תשובה ריקה. תמיד החזר תוכן או את הודעת "{no_info_message}"
+- כתוב בעברית תקינה וברורה.
+"""
+        # Fixed for an object across retries; feedback and the closing line are appended per attempt
+        self.prompt_template: str = """מקורות המידע:
 ---
 הנחיית המשתמש: {user_prompt}
 
@@ -190,53 +264,172 @@ class SlideAgent:
 
 שקף: {slide_description}
 פורמט נדרש: {object_description}
+"""
 
-{language_instruction}
-
-{validation_feedback}
-
-הנחיות:
-- חלץ מידע רלוונטי מהמקורות למעלה וארגן אותו לפי הפורמט הנדרש.
-- מותר לנסח מחדש, לסכם, ולארגן — זו המטרה שלך.
-- אם המקורות לא מכילים מידע רלוונטי לשקף הזה, החזר בדיוק: "{no_info_message}"
-- אין להמציא תאריכים, שעות, שנים, מספרים, שמות, או נתונים כמותיים שלא מופיעים במפורש במקורות.
-- אם אתה מוצא את עצמך כותב פרט ספציפי שלא קיים במקורות — עצור והחזר את הודעת "{no_info_message}"
-- אל תחזיר תשובה ריקה. תמיד החזר תוכן או את הודעת "{no_info_message}"
-- כתוב בעברית תקינה וברורה.
-
-החזר רק את התוכן:
-""",
+    def generate_slide(
+        self, slide: dict, user_prompt: str, document_text: str = "", drafts: Optional[dict] = None
+    ) -> dict:
+        """Generate content for every object in a slide, starting from batch drafts.
+
+        Without drafts from generate_all_slides, a slide with several content objects
+        drafts them all in one batched call instead of one call per object.
+        """
+        slide_num: str = str(slide.get("slide_num", ""))
+        if drafts is None and sum(map(self._is_batchable_object, slide["slide_objects"])) > 1:
+            drafts = self.generate_slides_batch([slide], user_prompt, document_text)
+        object_drafts: list[Optional[str]] = [
+            (drafts or {}).get((slide_num, obj.get("object_id", ""))) for obj in slide["slide_objects"]
+        ]
+        self._process_objects(
+            slide["slide_objects"], slide["slide_description"], user_prompt, document_text, object_drafts
         )
-
-    def generate_slide(self, slide: dict, user_prompt: str, document_text: str = "") -> dict:
-        """Generate content for every object in a slide."""
-        for obj in slide["slide_objects"]:
-            self._process_single_object(obj, slide["slide_description"], user_prompt, document_text)
         slide["generation_status"] = "completed"
         return slide
 
-    def generate_all_slides(self, slides: list[dict], user_prompt: str, document_text: str, max_workers: int = 4) -> None:
-        """Generate content for all slides in parallel."""
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.generate_slide, slide=slide, user_prompt=user_prompt, document_text=document_text): slide
-                for slide in slides
+    def generate_all_slides(
+        self, slides: list[dict], user_prompt: str, document_text: str, max_workers: Optional[int] = None
+    ) -> None:
+        """Draft slides in batched LLM calls, then validate each slide in parallel.
+
+        Slides are chunked so each chunk's content objects fit one drafting call.
+        A chunk's slides are submitted for validation as soon as its drafts return,
+        so drafting and validation overlap across chunks.
+        """
+        chunks: list[list[dict]] = self._chunk_slides_by_objects(slides)
+        max_workers = max_workers or settings.settings.max_parallel_llm_calls
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(slides)))) as executor:
+            draft_futures = {
+                executor.submit(self.generate_slides_batch, chunk, user_prompt, document_text): chunk
+                for chunk in chunks
             }
-            for future in as_completed(futures):
+            slide_futures: list = []
+            for draft_future in as_completed(draft_futures):
+                drafts: dict = draft_future.result()
+                slide_futures.extend(
+                    executor.submit(
+                        self.generate_slide, slide=slide, user_prompt=user_prompt,
+                        document_text=document_text, drafts=drafts,
+                    )
+                    for slide in draft_futures[draft_future]
+                )
+            for future in slide_futures:
                 future.result()
 
+    def _chunk_slides_by_objects(self, slides: list[dict]) -> list[list[dict]]:
+        """Group consecutive slides so each group holds at most one batch call's worth of objects."""
+        per_call: int = self._max_objects_per_batch()
+        chunks: list[list[dict]] = []
+        current: list[dict] = []
+        current_objects: int = 0
+        for slide in slides:
+            object_count: int = sum(map(self._is_batchable_object, slide.get("slide_objects", [])))
+            if current and current_objects + object_count > per_call:
+                chunks.append(current)
+                current, current_objects = [], 0
+            current.append(slide)
+            current_objects += object_count
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def generate_slides_batch(
+        self, slides: list[dict], user_prompt: str, document_text: str
+    ) -> dict[tuple[str, str], str]:
+        """Draft content for every plain content object, keyed by (slide_num, object_id).
+
+        Objects are drafted together in as few LLM calls as _BATCH_MAX_TOKENS allows.
+        """
+        batch_objects: list[dict] = [
+            {
+                "slide_num": slide.get("slide_num"),
+                "slide_description": slide.get("slide_description", ""),
+                "object_id": obj.get("object_id", ""),
+                "object_description": obj.get("object_description", ""),
+            }
+            for slide in slides
+            for obj in slide.get("slide_objects", [])
+            if self._is_batchable_object(obj)
+        ]
+        per_call: int = self._max_objects_per_batch()
+        drafts: dict[tuple[str, str], str] = {}
+        for i in range(0, len(batch_objects), per_call):
+            drafts.update(self._draft_object_group(batch_objects[i:i + per_call], user_prompt, document_text))
+        return drafts
+
+    def _draft_object_group(
+        self, batch_objects: list[dict], user_prompt: str, document_text: str
+    ) -> dict[tuple[str, str], str]:
+        """Draft one group of batch objects in a single LLM call."""
+        from prompts import build_batch_generation_prompt
+
+        prompt: str = build_batch_generation_prompt(
+            objects_json=orjson.dumps(batch_objects, option=orjson.OPT_INDENT_2).decode(),
+            user_prompt=user_prompt,
+            document_text=document_text,
+            language_instruction=self.language_instruction,
+            no_info_message=settings.settings.no_info_message,
+        )
+        max_tokens: int = min(settings.agents.generation.max_tokens * len(batch_objects), _BATCH_MAX_TOKENS)
+        raw_response: str = call_llm(prompt, role="generation", max_tokens=max_tokens)
+
+        try:
+            results: list = parse_llm_json(raw_response).get("results", [])
+        except (orjson.JSONDecodeError, ValueError, AttributeError) as e:
+            print(f"[SlideAgent] Batch draft parse failed, falling back to per-object generation: {e}")
+            return {}
+
+        return {
+            (str(item.get("slide_num", "")), item.get("object_id", "")): item["content"]
+            for item in results
+            if isinstance(item, dict) and isinstance(item.get("content"), str)
+        }
+
     def regenerate_pending_objects(self, slide: dict, user_prompt: str, document_text: str) -> None:
         """Regenerate only objects marked as pending_regeneration in a slide."""
-        for obj in slide.get("slide_objects", []):
-            if obj.get("validation_status") == "pending_regeneration":
-                self._process_single_object(
-                    obj, slide["slide_description"], user_prompt, document_text
-                )
+        pending: list[dict] = [
+            obj for obj in slide.get("slide_objects", [])
+            if obj.get("validation_status") == "pending_regeneration"
+        ]
+        self._process_objects(pending, slide["slide_description"], user_prompt, document_text)
 
     # ── Object-Level Processing ──
 
+    def _process_objects(
+        self, objects: list[dict], slide_description: str, user_prompt: str, document_text: str,
+        drafts: Optional[list[Optional[str]]] = None,
+    ) -> None:
+        """Process a slide's objects, running the ones that need LLM calls concurrently.
+
+        Titles and no-source objects are filled inline; each remaining object's
+        generate/validate loop is independent, so they share a small thread pool.
+        """
+        drafts = drafts or [None] * len(objects)
+        llm_jobs: list[tuple[dict, Optional[str]]] = []
+        for obj, draft in zip(objects, drafts):
+            if self._is_title_object(obj) or obj.get("has_source_content") is False:
+                self._process_single_object(obj, slide_description, user_prompt, document_text)
+            else:
+                llm_jobs.append((obj, draft))
+
+        if len(llm_jobs) <= 1:
+            for obj, draft in llm_jobs:
+                self._process_single_object(obj, slide_description, user_prompt, document_text, draft)
+            return
+
+        max_workers: int = min(len(llm_jobs), settings.settings.max_parallel_llm_calls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: list = [
+                executor.submit(
+                    self._process_single_object, obj, slide_description, user_prompt, document_text, draft
+                )
+                for obj, draft in llm_jobs
+            ]
+            for future in futures:
+                future.result()
+
     def _process_single_object(
-        self, obj: dict, slide_description: str, user_prompt: str, document_text: str
+        self, obj: dict, slide_description: str, user_prompt: str, document_text: str,
+        draft: Optional[str] = None,
     ) -> None:
         """Route a single slide object to the right generation strategy."""
         if self._is_title_object(obj):
@@ -251,7 +444,7 @@ class SlideAgent:
             self._fill_infographic_object(obj, slide_description, user_prompt, document_text)
             return
 
-        self._fill_content_object(obj, slide_description, user_prompt, document_text)
+        self._fill_content_object(obj, slide_description, user_prompt, document_text, draft)
 
     def _fill_title_object(self, obj: dict) -> None:
         """Populate a title object by extracting text from its name."""
@@ -269,7 +462,8 @@ class SlideAgent:
         obj["validation_raw"] = ""
 
     def _fill_content_object(
-        self, obj: dict, slide_description: str, user_prompt: str, document_text: str
+        self, obj: dict, slide_description: str, user_prompt: str, document_text: str,
+        draft: Optional[str] = None,
     ) -> None:
         """Generate and validate content, then store results on the object."""
         result: dict = self._generate_with_validation(
@@ -277,6 +471,7 @@ class SlideAgent:
             object_description=obj["object_description"],
             user_prompt=user_prompt,
             document_text=document_text,
+            draft=draft,
         )
         obj["generated_content"] = result["content"]
         obj["validation_status"] = result["status"]
@@ -320,19 +515,39 @@ class SlideAgent:
         object_description: str,
         user_prompt: str,
         document_text: str,
+        draft: Optional[str] = None,
     ) -> dict:
-        """Try generating content up to max_retries+1 times, validating each attempt."""
+        """Try generating content up to max_retries+1 times, validating each attempt.
+
+        A batch draft, when given, is validated as the first attempt instead of a fresh call.
+        With fused_validation enabled, each fresh attempt writes and checks the content in
+        one call; the separate validator only runs when the fused verdict can't be parsed.
+        """
         validation_feedback: str = ""
+        prompt_body: Optional[str] = None
+        rejected_content: Optional[str] = None
         total_attempts: int = 1 + self.max_retries
         last_reason: str = ""
         last_feedback: str = ""
         last_raw: str = ""
 
         for attempt in range(1, total_attempts + 1):
-            content: str = self._generate_with_llm(
-                slide_description, object_description,
-                user_prompt, document_text, validation_feedback,
-            )
+            validation: Optional[dict] = None
+            generation_prompt: Optional[str] = None
+            if attempt == 1 and draft is not None:
+                content: str = draft
+            elif settings.settings.fused_validation:
+                content, validation = self._generate_fused(
+                    slide_description, object_description,
+                    user_prompt, document_text, validation_feedback,
+                )
+            else:
+                if prompt_body is None:
+                    prompt_body = self._format_prompt_body(
+                        slide_description, object_description, user_prompt, document_text,
+                    )
+                generation_prompt = self._format_attempt_prompt(prompt_body, validation_feedback)
+                content = self._generate_with_llm(generation_prompt)
 
             if not content or not content.strip():
                 last_reason, last_feedback, last_raw = self._handle_empty_attempt()
@@ -340,25 +555,36 @@ class SlideAgent:
                     validation_feedback = self._empty_content_feedback()
                 continue
 
-            validation: dict = self.validator.validate(
-                generated_content=content,
-                user_prompt=user_prompt,
-                slide_description=slide_description,
-                object_description=object_description,
-                document_text=document_text,
-            )
+            if content == rejected_content:
+                # The model repeated the answer that was just rejected; further retries won't converge
+                break
+
+            if validation is None:
+                validation = self.validator.validate(
+                    generated_content=content,
+                    user_prompt=user_prompt,
+                    slide_description=slide_description,
+                    object_description=object_description,
+                    document_text=document_text,
+                )
 
             last_reason = validation.get("reason", "")
             last_feedback = validation.get("feedback", "")
             last_raw = validation.get("raw_response", "")
 
             if validation["is_valid"]:
+                if generation_prompt is not None:
+                    # Only accepted content is cached, so a rejected object gets fresh calls when regenerated
+                    cache_llm_response(
+                        generation_prompt, content, role="generation", system_prompt=self.system_prompt,
+                    )
                 return self._success_result(content, attempt, last_reason, last_raw)
 
+            rejected_content = content
             if attempt < total_attempts:
                 validation_feedback = self._build_retry_feedback(validation)
 
-        return self._failure_result(total_attempts, last_reason, last_feedback, last_raw)
+        return self._failure_result(attempt, last_reason, last_feedback, last_raw)
 
     # ── Validation-Loop Helpers ──
 
@@ -404,12 +630,12 @@ class SlideAgent:
         }
 
     @staticmethod
-    def _failure_result(total_attempts: int, reason: str, feedback: str, raw: str) -> dict:
-        """Build the result dict when all validation attempts are exhausted."""
+    def _failure_result(attempts: int, reason: str, feedback: str, raw: str) -> dict:
+        """Build the result dict when validation attempts are exhausted or stop converging."""
         return {
             "content": settings.settings.no_info_message,
             "status": "failed_validation",
-            "attempts": total_attempts,
+            "attempts": attempts,
             "reason": reason or "כל הניסיונות נכשלו",
             "feedback": feedback or "לא התקבל משוב מהבודק",
             "raw_response": raw,
@@ -417,58 +643,101 @@ class SlideAgent:
 
     # ── LLM Interaction ──
 
-    def _generate_with_llm(
+    def _format_prompt_body(
+        self, slide_description: str, object_description: str, user_prompt: str, document_text: str
+    ) -> str:
+        """Format the per-object part of the generation prompt, shared by all its attempts."""
+        return self.prompt_template.format(
+            user_prompt=user_prompt,
+            slide_description=slide_description,
+            object_description=object_description,
+            document_text=document_text or "לא סופק",
+        )
+
+    @staticmethod
+    def _format_attempt_prompt(prompt_body: str, validation_feedback: str = "") -> str:
+        """Append this attempt's feedback to the prompt body."""
+        return f"{prompt_body}\n{validation_feedback}\n\nהחזר רק את התוכן:\n"
+
+    def _generate_with_llm(self, formatted_prompt: str) -> str:
+        """Call the generation LLM, reusing a cached reply for a prompt whose content was accepted.
+
+        Replies are stored only once they pass validation (see _generate_with_validation),
+        so regenerating an unchanged object reuses its validated draft while a rejected
+        object is generated afresh.
+        """
+        return call_llm_cached(
+            formatted_prompt, role="generation", system_prompt=self.system_prompt, store=False,
+        )
+
+    def _generate_fused(
         self,
         slide_description: str,
         object_description: str,
         user_prompt: str,
         document_text: str,
         validation_feedback: str = "",
-    ) -> str:
-        """Format the prompt and call the generation LLM."""
-        formatted_prompt: str = self.prompt_template.format(
-            user_prompt=user_prompt,
+    ) -> tuple[str, Optional[dict]]:
+        """Generate content and its validation verdict in one call.
+
+        Returns the content and the parsed verdict, or None for the verdict when the
+        response has no usable VALID/REASON/FEEDBACK block.
+        """
+        from prompts import build_fused_generation_prompt
+
+        prompt: str = build_fused_generation_prompt(
             slide_description=slide_description,
             object_description=object_description,
-            document_text=document_text or "לא סופק",
-            language_instruction=self._get_language_instruction(),
+            user_prompt=user_prompt,
+            document_text=document_text,
+            language_instruction=self.language_instruction,
             validation_feedback=validation_feedback,
             no_info_message=settings.settings.no_info_message,
         )
-        return call_llm(formatted_prompt, role="generation")
+        max_tokens: int = settings.agents.generation.max_tokens + settings.agents.validation.max_tokens
+        response: str = call_llm(prompt, role="generation", max_tokens=max_tokens)
+
+        separators: list[re.Match] = list(_FUSED_SEPARATOR_RE.finditer(response))
+        if not separators:
+            return response.strip(), None
+        content: str = response[:separators[-1].start()].strip()
+        verdict: str = response[separators[-1].end():]
+        if "VALID" not in verdict.upper():
+            return content, None
+        return content, self.validator._parse_validation_response(verdict)
 
     # ── Utilities ──
 
-    def _get_language_instruction(self) -> str:
-        """Return a language instruction string based on the configured language."""
-        if self.language.lower() == "hebrew":
-            return "כתוב בעברית בלבד."
-        return "Generate output in the same language as the input."
+    @staticmethod
+    def _max_objects_per_batch() -> int:
+        """Number of objects one batched drafting call can hold within _BATCH_MAX_TOKENS."""
+        return max(1, _BATCH_MAX_TOKENS // settings.agents.generation.max_tokens)
+
+    def _is_batchable_object(self, obj: dict) -> bool:
+        """Check whether an object goes through the plain generate/validate path."""
+        return (
+            not self._is_title_object(obj)
+            and obj.get("has_source_content") is not False
+            and obj.get("object_type") != "infographic"
+        )
 
     @staticmethod
     def _is_title_object(obj: dict) -> bool:
         """Check whether a slide object is a title (not content)."""
-        name: str = obj["object_name"].lower()
-        return any(word in name for word in ["תת", "כותרת"])
+        return _TITLE_WORD_RE.search(obj["object_name"]) is not None
 
     @staticmethod
     def _generate_title(object_name: str) -> str:
         """Extract clean title text from an object name string."""
-        name: str = object_name.strip()
-        for word in ["כותרת", "תת"]:
-            name = name.replace(word, "")
-        return " ".join(name.split())
+        return " ".join(_TITLE_WORD_RE.sub("", object_name).split())
 
     @staticmethod
     def _clean_code_fences(content: str) -> str:
         """Strip markdown code fences if present."""
         cleaned: str = content.strip()
-        if cleaned.startswith("```json"):
-            cleaned = "\n".join(cleaned.split("\n")[1:])
-        elif cleaned.startswith("```mermaid"):
-            cleaned = "\n".join(cleaned.split("\n")[1:])
-        elif cleaned.startswith("```"):
-            cleaned = "\n".join(cleaned.split("\n")[1:])
+        # Any opening fence (```json, ```mermaid, bare ```) is dropped with its line
+        if cleaned.startswith("```"):
+            cleaned = cleaned[cleaned.find("\n") + 1:] if "\n" in cleaned else ""
         if cleaned.endswith("```"):
-            cleaned = "\n".join(cleaned.split("\n")[:-1])
+            cleaned = cleaned[:max(cleaned.rfind("\n"), 0)]
         return cleaned.strip()
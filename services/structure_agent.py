@@ -1,6 +1,8 @@
-import json
 from typing import Optional
-from utils.state import deck_state
+
+import orjson
+
+from utils.state import deck_state, with_deck_lock
 from utils.llm import call_llm_raw, parse_llm_json
 from utils.slide_builder import build_base_slide_entry, build_content_objects_for_layout
 from ui.renderers import render_outline_html
@@ -36,7 +38,7 @@ def generate_outline(user_prompt: str, document_text: str, slide_count: Optional
         raw_response: str = call_llm_raw(prompt)
         try:
             return parse_llm_json(raw_response)
-        except (json.JSONDecodeError, ValueError) as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             last_error = str(e)
             print(f"[Structure] JSON parse failed (attempt {attempt}/{max_attempts}): {last_error}")
 
@@ -45,13 +47,14 @@ def generate_outline(user_prompt: str, document_text: str, slide_count: Optional
 
 #  Outline Editing
 
+@with_deck_lock
 def edit_outline(edit_instruction: str) -> tuple[str, str]:
     """Edit the pending outline based on a user instruction."""
     outline: Optional[dict] = deck_state.get("pending_outline")
     if outline is None:
         return "❌ אין מבנה מוצע לעריכה", ""
 
-    outline_json: str = json.dumps(outline, indent=2, ensure_ascii=False)
+    outline_json: str = orjson.dumps(outline, option=orjson.OPT_INDENT_2).decode()
     prompt: str = build_outline_edit_prompt(outline_json, edit_instruction)
 
     try:
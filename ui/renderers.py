@@ -6,23 +6,38 @@ from utils.state import deck_state
 
 
 def format_slide_preview(slide: dict) -> str:
-    """Render a single slide as Markdown for the slide-level editing tab."""
-    lines: list[str] = []
-    lines.append(f"**שקף {slide.get('slide_num')}:** {slide.get('slide_description', '')}")
-    lines.append(f"**סטטוס:** {slide.get('generation_status', 'ממתין')}")
-    lines.append("")
-    for obj in slide.get("slide_objects", []):
-        obj_id: str = obj.get("object_id", "?")
-        obj_name: str = obj.get("object_name", "?")
-        status: str = obj.get("validation_status", "לא נוצר")
-        content: str = obj.get("generated_content", "")
-        icon: str = STATUS_ICONS.get(status, "⏳")
-        lines.append("---")
-        lines.append(f"{icon} **{obj_id}** — {obj_name}")
-        lines.append(f"סטטוס: {status}")
-        lines.append("תוכן:")
-        lines.append(f"```\n{content or '(ריק)'}\n```")
-    return "\n".join(lines)
+    """Render a single slide as Markdown for the slide-level editing tab.
+
+    Previews are cached per slide and dropped by mark_skeleton_changed when that slide is edited.
+    """
+    skeleton: Optional[dict] = deck_state["skeleton"]
+    cached: Optional[tuple[dict, dict]] = deck_state["slide_preview_cache"]
+    if cached is None or cached[0] is not skeleton:
+        cached = (skeleton, {})
+        deck_state["slide_preview_cache"] = cached
+    by_slide: dict[int, tuple[dict, str]] = cached[1]
+    entry: Optional[tuple[dict, str]] = by_slide.get(id(slide))
+    if entry is not None and entry[0] is slide:
+        return entry[1]
+
+    header: str = (
+        f"**שקף {slide.get('slide_num')}:** {slide.get('slide_description', '')}\n"
+        f"**סטטוס:** {slide.get('generation_status', 'ממתין')}\n"
+    )
+    preview: str = header + "".join(_format_preview_object(obj) for obj in slide.get("slide_objects", []))
+    by_slide[id(slide)] = (slide, preview)
+    return preview
+
+
+def _format_preview_object(obj: dict) -> str:
+    """Render one slide object as a Markdown block for the slide preview."""
+    status: str = obj.get("validation_status", "לא נוצר")
+    content: str = obj.get("generated_content", "")
+    icon: str = STATUS_ICONS.get(status, "⏳")
+    return (
+        f"\n---\n{icon} **{obj.get('object_id', '?')}** — {obj.get('object_name', '?')}\n"
+        f"סטטוס: {status}\nתוכן:\n```\n{content or '(ריק)'}\n```"
+    )
 
 
 def render_slide_html(slide: dict, slide_index: int, total_slides: int) -> str:
@@ -53,25 +68,24 @@ def _extract_slide_parts(slide: dict) -> tuple[str, list[str]]:
     body_parts: list[str] = []
 
     for obj in slide.get("slide_objects", []):
-        obj_name: str = obj.get("object_name", "").lower()
-        obj_id: str = obj.get("object_id", "")
         content: str = obj.get("generated_content", "")
-        status: str = obj.get("validation_status", "")
         if not content:
             continue
+        obj_name: str = obj.get("object_name", "")
+        obj_name_lower: str = obj_name.lower()
 
-        if "כותרת" in obj_name or "תת" in obj_name:
+        if "כותרת" in obj_name_lower or "תת" in obj_name_lower:
             title_text = content
         else:
-            icon: str = STATUS_ICONS.get(status, "⏳")
+            obj_id: str = obj.get("object_id", "")
+            icon: str = STATUS_ICONS.get(obj.get("validation_status", ""), "⏳")
             if obj_id == "Key Statement":
                 body_parts.append(f'<div class="slide-key-statement">{content}</div>')
             elif obj_id in ("Content Right", "Content Left"):
                 col_class: str = "slide-col-right" if obj_id == "Content Right" else "slide-col-left"
-                col_label: str = obj.get("object_name", "")
-                body_parts.append(_render_content_block(content, icon, col_label, col_class))
+                body_parts.append(_render_content_block(content, icon, obj_name, col_class))
             else:
-                body_parts.append(_render_content_block(content, icon, obj.get("object_name", "")))
+                body_parts.append(_render_content_block(content, icon, obj_name))
 
     return title_text, body_parts
 
@@ -100,41 +114,34 @@ def _render_content_block(
     content: str, icon: str, label: str, wrapper_class: Optional[str] = None
 ) -> str:
     """Render a content block as either a bullet list or paragraph."""
-    is_bullets: bool = _detect_bullets(content)
+    lines: list[str] = content.split("\n")
+    label_class: str = "slide-col-label" if wrapper_class and "col" in wrapper_class else "slide-obj-label"
 
-    if is_bullets:
-        items_html: str = _build_bullet_items(content)
-        inner = f'<div class="slide-obj-label">{icon} {label}</div><ul class="slide-bullets">{items_html}</ul>'
+    if _detect_bullets(lines):
+        inner = f'<div class="{label_class}">{icon} {label}</div><ul class="slide-bullets">{_build_bullet_items(lines)}</ul>'
     else:
-        inner = f'<div class="slide-obj-label">{icon} {label}</div><p class="slide-text">{content}</p>'
+        inner = f'<div class="{label_class}">{icon} {label}</div><p class="slide-text">{content}</p>'
 
     if wrapper_class:
-        label_class: str = "slide-col-label" if "col" in wrapper_class else "slide-obj-label"
-        if is_bullets:
-            inner = f'<div class="{label_class}">{icon} {label}</div><ul class="slide-bullets">{items_html}</ul>'
-        else:
-            inner = f'<div class="{label_class}">{icon} {label}</div><p class="slide-text">{content}</p>'
         return f'<div class="{wrapper_class}">{inner}</div>'
     return inner
 
 
-def _detect_bullets(content: str) -> bool:
-    """Check whether content looks like a bullet list."""
-    return "\n" in content and any(
-        line.strip().startswith(("-", "•", "–")) for line in content.split("\n")
-    )
+def _detect_bullets(lines: list[str]) -> bool:
+    """Check whether the content lines look like a bullet list."""
+    return len(lines) > 1 and any(line.strip().startswith(("-", "•", "–")) for line in lines)
 
 
-def _build_bullet_items(content: str) -> str:
-    """Convert raw bullet-list text into <li> HTML items."""
-    items: str = ""
-    for line in content.split("\n"):
+def _build_bullet_items(lines: list[str]) -> str:
+    """Convert raw bullet-list lines into <li> HTML items."""
+    items: list[str] = []
+    for line in lines:
         line = line.strip()
         if line.startswith(("-", "•", "–")):
             line = line.lstrip("-•– ").strip()
         if line:
-            items += f"<li>{line}</li>"
-    return items
+            items.append(f"<li>{line}</li>")
+    return "".join(items)
 
 
 #  Deck Preview
@@ -145,14 +152,35 @@ def render_deck_preview(skeleton: Optional[dict] = None) -> str:
         skeleton = deck_state.get("skeleton")
     if skeleton is None:
         return '<div class="preview-empty">אין מצגת לתצוגה מקדימה</div>'
+    cached: Optional[tuple[dict, str]] = deck_state["deck_html_cache"]
+    if cached is not None and cached[0] is skeleton:
+        return cached[1]
     slides: list[dict] = skeleton.get("slides", [])
     total: int = len(slides)
-    slides_html: str = "\n".join(render_slide_html(slide, i, total) for i, slide in enumerate(slides))
-    return f'''
+    slides_html: str = "\n".join(_cached_slide_html(skeleton, slide, i, total) for i, slide in enumerate(slides))
+    deck_html: str = f'''
     <div class="deck-preview">
         <div class="preview-header">📊 תצוגה מקדימה — {total} שקפים</div>
         <div class="slides-container">{slides_html}</div>
     </div>'''
+    deck_state["deck_html_cache"] = (skeleton, deck_html)
+    return deck_html
+
+
+def _cached_slide_html(skeleton: dict, slide: dict, slide_index: int, total_slides: int) -> str:
+    """Return a slide's preview HTML, re-rendering only slides marked as changed."""
+    cached: Optional[tuple[dict, int, dict]] = deck_state["slide_html_cache"]
+    if cached is None or cached[0] is not skeleton or cached[1] != total_slides:
+        # Footers embed the slide count, so a different total re-renders every slide
+        cached = (skeleton, total_slides, {})
+        deck_state["slide_html_cache"] = cached
+    by_slide: dict[int, tuple[dict, str]] = cached[2]
+    entry: Optional[tuple[dict, str]] = by_slide.get(id(slide))
+    if entry is not None and entry[0] is slide:
+        return entry[1]
+    html: str = render_slide_html(slide, slide_index, total_slides)
+    by_slide[id(slide)] = (slide, html)
+    return html
 
 
 #  Outline Preview
@@ -169,9 +197,7 @@ def render_outline_html(outline: dict) -> str:
     if without_content > 0:
         warning_html = f'<div class="outline-warning">⚠️ {without_content} שקפים מסומנים כחסרי מידע מספיק</div>'
 
-    slides_html: str = ""
-    for slide in slides:
-        slides_html += _render_outline_slide_card(slide)
+    slides_html: str = "".join(_render_outline_slide_card(slide) for slide in slides)
 
     return f'''
     <div class="outline-preview">
@@ -1,4 +1,4 @@
 from utils.state import deck_state, get_slide_choices, parse_slide_num_from_selection, get_slide_by_num, detect_slide_count
-from utils.llm import call_llm, call_llm_raw, parse_llm_json
+from utils.llm import call_llm, call_llm_cached, cache_llm_response, call_llm_raw, parse_llm_json
 from utils.revision_manager import RevisionManager
 from utils.slide_builder import build_base_slide_entry, build_content_objects_for_layout
@@ -2,21 +2,66 @@
 
 import os
 import re
-import json
+import hashlib
+import threading
+import time
 import httpx
+import orjson
+from collections import OrderedDict
+from typing import Optional
 from dotenv import load_dotenv
 from json_repair import repair_json
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 
 from config import settings
+from schemas.config.llm_api_config import AgentParams
 
 load_dotenv()
 
+_API_KEY: str = os.getenv(settings.model.api_key_env, "")
+if not _API_KEY:
+    print(f"[LLM] Warning: {settings.model.api_key_env} is not set — LLM calls will fail")
+
 #  Lazy Model Cache (created on first use, not at import time)
 
 _models: dict[str, ChatOpenAI] = {}
+_models_lock = threading.Lock()
+# Caps in-flight requests across every thread pool (slides, objects, regeneration)
+_llm_call_slots = threading.BoundedSemaphore(settings.settings.max_parallel_llm_calls)
+_http_clients: Optional[tuple[httpx.Client, httpx.AsyncClient]] = None
+
+
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Return the sync/async HTTP clients shared by every role, so connections are pooled."""
+    global _http_clients
+    if _http_clients is None:
+        # Keep enough idle connections alive for a full burst of parallel calls,
+        # so slide generation doesn't pay a fresh TLS handshake per worker
+        parallel: int = settings.settings.max_parallel_llm_calls
+        limits = httpx.Limits(max_connections=parallel * 4, max_keepalive_connections=parallel * 2)
+        _http_clients = (
+            httpx.Client(verify=False, limits=limits),
+            httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(verify=False, limits=limits)),
+        )
+    return _http_clients
+
+
+def _get_agent_config(role: str) -> AgentParams:
+    """Return the configured parameters for a role, defaulting to the generation role."""
+    agent_configs: dict[str, AgentParams] = {
+        "generation": settings.agents.generation,
+        "validation": settings.agents.validation,
+        "edit": settings.agents.edit,
+        "structure": settings.agents.structure,
+    }
+    return agent_configs.get(role, settings.agents.generation)
+
+
+def _get_model_name(role: str) -> str:
+    """Return the model a role calls: its own override, or the shared default model."""
+    return _get_agent_config(role).model or settings.model.name
 
 
 def _get_model(role: str) -> ChatOpenAI:
@@ -24,62 +69,145 @@ def _get_model(role: str) -> ChatOpenAI:
     if role in _models:
         return _models[role]
 
-    api_key: str = os.getenv(settings.model.api_key_env, "")
-    base_url: str = f"{settings.model.url}/{settings.model.api_endpoint.split('/', 1)[0]}"
-    http_client = httpx.Client(verify=False)
-    http_async_client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(verify=False))
-
-    agent_configs: dict = {
-        "generation": settings.agents.generation,
-        "validation": settings.agents.validation,
-        "edit": settings.agents.edit,
-        "structure": settings.agents.structure,
-    }
-    agent_cfg = agent_configs.get(role, settings.agents.generation)
-
-    _models[role] = ChatOpenAI(
-        model_name=settings.model.name,
-        api_key=api_key,
-        base_url=base_url,
-        http_client=http_client,
-        http_async_client=http_async_client,
-        temperature=agent_cfg.temperature,
-        top_p=agent_cfg.top_p,
-        max_tokens=agent_cfg.max_tokens,
-    )
-    return _models[role]
+    with _models_lock:
+        if role in _models:
+            return _models[role]
+
+        base_url: str = f"{settings.model.url}/{settings.model.api_endpoint.split('/', 1)[0]}"
+        http_client, http_async_client = _get_http_clients()
+
+        agent_cfg = _get_agent_config(role)
+
+        _models[role] = ChatOpenAI(
+            model_name=_get_model_name(role),
+            api_key=_API_KEY,
+            base_url=base_url,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            temperature=agent_cfg.temperature,
+            top_p=agent_cfg.top_p,
+            max_tokens=agent_cfg.max_tokens,
+        )
+        return _models[role]
 
 
 #  Call Helpers
 
-def call_llm(prompt: str, role: str = "generation") -> str:
-    """Send a prompt to the LLM using the model configured for the given role."""
+def call_llm(
+    prompt: str,
+    role: str = "generation",
+    max_tokens: Optional[int] = None,
+    system_prompt: Optional[str] = None,
+    json_mode: bool = False,
+) -> str:
+    """Send a prompt to the LLM using the model configured for the given role.
+
+    A static system_prompt is sent as a leading system message, so providers can
+    reuse their cached prefix across calls. json_mode asks the provider to return
+    a single JSON object. At most max_parallel_llm_calls requests run at once;
+    further callers wait for a free slot.
+    """
     model: ChatOpenAI = _get_model(role)
+    overrides: dict = {"max_tokens": max_tokens} if max_tokens else {}
+    if json_mode:
+        overrides["response_format"] = {"type": "json_object"}
+    messages: list[BaseMessage] = [HumanMessage(content=prompt)]
+    if system_prompt:
+        messages.insert(0, SystemMessage(content=system_prompt))
 
     try:
-        response = model.invoke([HumanMessage(content=prompt)])
+        with _llm_call_slots:
+            response = model.invoke(messages, **overrides)
         return response.content or ""
     except Exception as e:
         print(f"[LLM] Error ({role}): {e}")
         return ""
 
 
+#  Response Cache
+
+_RESPONSE_CACHE_SIZE: int = 1024
+_RESPONSE_CACHE_TTL_SECONDS: float = 3600.0
+_response_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_response_cache_lock = threading.Lock()
+# Roles whose prompts are built from templates, so whitespace differences carry no meaning
+_WHITESPACE_INSENSITIVE_ROLES: frozenset[str] = frozenset({"generation", "validation"})
+
+
+def _response_cache_key(
+    prompt: str, role: str, system_prompt: Optional[str] = None, json_mode: bool = False
+) -> str:
+    """Return a stable hash of (model, role, JSON mode, system prompt, prompt) for the response cache.
+
+    For generation and validation, whitespace in the prompt is collapsed first, so
+    template prompts differing only in spacing or blank lines share an entry. Other
+    roles keep the exact prompt, so a user retrying a request with reworded spacing
+    gets a fresh call.
+    """
+    if role in _WHITESPACE_INSENSITIVE_ROLES:
+        prompt = " ".join(prompt.split())
+    raw: str = f"{_get_model_name(role)}\0{role}\0{int(json_mode)}\0{system_prompt or ''}\0{prompt}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def call_llm_cached(
+    prompt: str,
+    role: str = "generation",
+    system_prompt: Optional[str] = None,
+    json_mode: bool = False,
+    store: bool = True,
+) -> str:
+    """Call the LLM, reusing a response under an hour old for an identical prompt.
+
+    With store=False a fresh response is not cached; the caller stores it with
+    cache_llm_response once it has checked the response is usable.
+    """
+    key: str = _response_cache_key(prompt, role, system_prompt, json_mode)
+    with _response_cache_lock:
+        entry: Optional[tuple[float, str]] = _response_cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < _RESPONSE_CACHE_TTL_SECONDS:
+                _response_cache.move_to_end(key)
+                return entry[1]
+            del _response_cache[key]
+
+    response: str = call_llm(prompt, role=role, system_prompt=system_prompt, json_mode=json_mode)
+    if response and store:
+        _store_response(key, response)
+    return response
+
+
+def cache_llm_response(
+    prompt: str, response: str, role: str = "generation",
+    system_prompt: Optional[str] = None, json_mode: bool = False,
+) -> None:
+    """Cache a response fetched with call_llm_cached(store=False) after the caller accepted it."""
+    if response:
+        _store_response(_response_cache_key(prompt, role, system_prompt, json_mode), response)
+
+
+def _store_response(key: str, response: str) -> None:
+    """Insert a response into the LRU cache, evicting the oldest entries over the size cap."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), response)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
 def call_llm_raw(prompt: str) -> str:
     """Call LLM with the structure role (used for outline generation)."""
     return call_llm(prompt, role="structure")
 
 
 
+_FENCE_RE: re.Pattern = re.compile(r"\A```[^\n]*\n?|\n?```\s*\Z")
+
+
 def parse_llm_json(raw_response: str) -> dict:
     """Parse a JSON object from an LLM response, repairing common LLM quirks."""
-    cleaned: str = raw_response.strip()
-
     # Strip markdown fences
-    if cleaned.startswith("```"):
-        cleaned = "\n".join(cleaned.split("\n")[1:])
-    if cleaned.endswith("```"):
-        cleaned = "\n".join(cleaned.split("\n")[:-1])
-    cleaned = cleaned.strip()
+    cleaned: str = _FENCE_RE.sub("", raw_response.strip()).strip()
 
     # Extract just the JSON object
     first_brace: int = cleaned.find("{")
@@ -89,10 +217,10 @@ def parse_llm_json(raw_response: str) -> dict:
 
     # Try standard parse first
     try:
-        return json.loads(cleaned)
-    except (json.JSONDecodeError, ValueError):
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         pass
 
     # Repair and retry
     repaired: str = repair_json(cleaned)
-    return json.loads(repaired)
\ No newline at end of file
+    return orjson.loads(repaired)
\ No newline at end of file
@@ -1,57 +1,116 @@
 """Revision manager — stores and restores deck snapshots."""
 
-import copy
+import zlib
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
+
+import orjson
+
 from config import settings
 
 
+# Snapshots larger than this are zlib-compressed (level 1: fast, still ~3-5x on JSON)
+_COMPRESS_THRESHOLD: int = 64 * 1024
+
+
 class RevisionManager:
     """Manages a capped history of deck revisions with snapshot/restore."""
 
     def __init__(self) -> None:
-        self.revisions: list[dict] = []
+        # The first revision is pinned; later ones roll through a bounded deque
+        self._first: Optional[dict] = None
+        self._rest: deque[dict] = deque(maxlen=max(1, settings.settings.max_revisions - 1))
+        self._by_id: dict[int, dict] = {}
         self.current_revision_id: int = 0
+        self._choices_cache: Optional[list[str]] = None
 
-    def save_revision(self, skeleton: dict, action: str, description: str) -> int:
-        """Save a deep-copy snapshot of the skeleton and return the new revision id."""
+    def save_revision(
+        self, skeleton: dict, action: str, description: str, snapshot_bytes: Optional[bytes] = None
+    ) -> int:
+        """Save a serialized snapshot of the skeleton and return the new revision id.
+
+        Snapshots use the same indented JSON as the deck JSON view, so callers that
+        already hold it (get_deck_json) can pass it as snapshot_bytes to skip
+        serializing the skeleton again. A skeleton holding a value JSON can't encode
+        raises TypeError here, since the deck view and export couldn't show it either.
+        """
+        snapshot: bytes = (
+            snapshot_bytes if snapshot_bytes is not None
+            else orjson.dumps(skeleton, option=orjson.OPT_INDENT_2)
+        )
         self.current_revision_id += 1
+        compressed: bool = len(snapshot) > _COMPRESS_THRESHOLD
         revision: dict = {
             "revision_id": self.current_revision_id,
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "action": action,
             "description": description,
-            "snapshot": copy.deepcopy(skeleton),
+            "snapshot_bytes": zlib.compress(snapshot, 1) if compressed else snapshot,
+            "snapshot_compressed": compressed,
         }
-        self.revisions.append(revision)
-        if len(self.revisions) > settings.settings.max_revisions:
-            self.revisions = [self.revisions[0]] + self.revisions[-(settings.settings.max_revisions - 1):]
+
+        if self._first is None:
+            self._first = revision
+        else:
+            if len(self._rest) == self._rest.maxlen:
+                evicted: dict = self._rest[0]
+                del self._by_id[evicted["revision_id"]]
+                if self._choices_cache is not None:
+                    self._choices_cache.pop(-2)
+            self._rest.append(revision)
+
+        self._by_id[self.current_revision_id] = revision
+        if self._choices_cache is not None:
+            self._choices_cache.insert(0, self._format_choice(revision))
         return self.current_revision_id
 
     def get_revision(self, revision_id: int) -> Optional[dict]:
         """Return the revision dict for a given id, or None."""
-        for rev in self.revisions:
-            if rev["revision_id"] == revision_id:
-                return rev
-        return None
+        return self._by_id.get(revision_id)
 
     def restore_revision(self, revision_id: int) -> Optional[dict]:
-        """Return a deep copy of the skeleton at a given revision, or None."""
+        """Return a fresh copy of the skeleton at a given revision, or None."""
         rev: Optional[dict] = self.get_revision(revision_id)
         if rev is None:
             return None
-        return copy.deepcopy(rev["snapshot"])
+        return orjson.loads(self._read_snapshot(rev))
+
+    def get_snapshot_json(self, revision_id: int) -> Optional[str]:
+        """Return the stored JSON text of a revision, or None."""
+        rev: Optional[dict] = self.get_revision(revision_id)
+        if rev is None:
+            return None
+        return self._read_snapshot(rev).decode("utf-8")
+
+    @staticmethod
+    def _read_snapshot(rev: dict) -> bytes:
+        """Return a revision's stored snapshot bytes, decompressed if needed."""
+        snapshot: bytes = rev["snapshot_bytes"]
+        if rev["snapshot_compressed"]:
+            snapshot = zlib.decompress(snapshot)
+        return snapshot
 
     def get_revision_choices(self) -> list[str]:
-        """Build a list of human-readable revision labels for UI dropdowns."""
-        choices: list[str] = []
-        for rev in reversed(self.revisions):
-            rid: int = rev["revision_id"]
-            ts: str = rev["timestamp"]
-            action: str = rev["action"]
-            desc: str = rev["description"]
-            choices.append(f"[גרסה {rid}] {ts} — {action}: {desc}")
-        return choices
+        """Return human-readable revision labels (newest first) for UI dropdowns."""
+        if self._choices_cache is None:
+            self._choices_cache = [self._format_choice(rev) for rev in self._iter_newest_first()]
+        return list(self._choices_cache)
+
+    def _iter_newest_first(self) -> Iterator[dict]:
+        """Yield stored revisions from newest to oldest, ending with the pinned first one."""
+        yield from reversed(self._rest)
+        if self._first is not None:
+            yield self._first
+
+    @staticmethod
+    def _format_choice(rev: dict) -> str:
+        """Format a single revision as a dropdown label."""
+        rid: int = rev["revision_id"]
+        ts: str = rev["timestamp"]
+        action: str = rev["action"]
+        desc: str = rev["description"]
+        return f"[גרסה {rid}] {ts} — {action}: {desc}"
 
     def get_latest_id(self) -> int:
         """Return the most recent revision id."""
@@ -59,5 +118,8 @@ class RevisionManager:
 
     def reset(self) -> None:
         """Clear all revisions and reset the counter."""
-        self.revisions = []
+        self._first = None
+        self._rest.clear()
+        self._by_id = {}
         self.current_revision_id = 0
+        self._choices_cache = []
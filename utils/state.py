@@ -1,8 +1,24 @@
+import functools
 import re
-from typing import Optional
+import threading
+from typing import Callable, Iterable, Optional
+
+import orjson
+
 from utils.revision_manager import RevisionManager
 
 
+_SLIDE_RE: re.Pattern = re.compile(r"\[שקף (.+?)\]")
+_SLIDE_COUNT_RES: tuple[re.Pattern, ...] = tuple(re.compile(p) for p in (
+    r'(\d+)\s*שקפים',
+    r'(\d+)\s*שקף',
+    r'(\d+)\s*עמוד',
+    r'(\d+)\s*עמודים',
+    r'(\d+)\s*slides?',
+    r'מצגת\s*(?:של|בת|עם)\s*(\d+)',
+))
+
+
 #  Global app state
 
 deck_state: dict = {
@@ -12,26 +28,137 @@ deck_state: dict = {
     "pending_outline": None,
     "user_prompt": "",
     "document_text": "",
+    "skeleton_json_cache": None,
+    "skeleton_index_cache": None,
+    "slide_html_cache": None,
+    "slide_preview_cache": None,
+    "deck_html_cache": None,
 }
 
+# Gradio events and API routes run in worker threads, and each handler changes the skeleton,
+# its caches and the revision history in several steps. Reentrant so locked API helpers can
+# call the locked service handlers.
+deck_lock = threading.RLock()
+
+
+def with_deck_lock(fn: Callable) -> Callable:
+    """Decorate a handler that mutates deck_state so it runs while holding deck_lock."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with deck_lock:
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+#  Serialized deck cache
+
+def get_deck_json() -> str:
+    """Return the current skeleton as indented JSON, serializing only when it changed."""
+    skeleton: Optional[dict] = deck_state["skeleton"]
+    cached: Optional[tuple[dict, str]] = deck_state["skeleton_json_cache"]
+    if cached is not None and cached[0] is skeleton:
+        return cached[1]
+    deck_json: str = orjson.dumps(skeleton or {}, option=orjson.OPT_INDENT_2).decode()
+    deck_state["skeleton_json_cache"] = (skeleton, deck_json)
+    return deck_json
+
+
+def install_skeleton(skeleton: dict, deck_json: Optional[str] = None) -> None:
+    """Make skeleton the current deck, seeding the JSON cache when its text is already known."""
+    deck_state["skeleton"] = skeleton
+    if deck_json is not None:
+        deck_state["skeleton_json_cache"] = (skeleton, deck_json)
+
+
+def mark_skeleton_changed(slide_nums: Optional[Iterable[str]] = None) -> None:
+    """Drop cached views of the skeleton after it was mutated in place.
+
+    When slide_nums is given, only those slides' preview HTML and Markdown are
+    dropped; otherwise every slide is re-rendered on the next preview.
+    """
+    deck_state["skeleton_json_cache"] = None
+    deck_state["skeleton_index_cache"] = None
+    deck_state["deck_html_cache"] = None
+    html_cache: Optional[tuple[dict, int, dict]] = deck_state["slide_html_cache"]
+    preview_cache: Optional[tuple[dict, dict]] = deck_state["slide_preview_cache"]
+    if slide_nums is None:
+        deck_state["slide_html_cache"] = None
+        deck_state["slide_preview_cache"] = None
+        return
+    dirty: set[str] = {str(num) for num in slide_nums}
+    if html_cache is not None:
+        _drop_cached_slides(html_cache[2], dirty)
+    if preview_cache is not None:
+        _drop_cached_slides(preview_cache[1], dirty)
+
+
+def _drop_cached_slides(by_slide: dict[int, tuple[dict, str]], dirty: set[str]) -> None:
+    """Remove per-slide cache entries whose slide_num is in dirty."""
+    for key in [k for k, (slide, _) in by_slide.items() if str(slide.get("slide_num", "")) in dirty]:
+        del by_slide[key]
+
+
+#  Skeleton lookup index
+
+def _build_skeleton_index(skeleton: dict) -> dict[str, dict]:
+    """Index slides by slide_num and objects by (slide_num, id), (slide_num, name) and name.
+
+    Object maps hold (slide_num, object) pairs so callers know which slide they touched.
+    """
+    slide_by_num: dict[str, dict] = {}
+    obj_by_slide_id: dict[tuple[str, str], tuple[str, dict]] = {}
+    obj_by_slide_name: dict[tuple[str, str], tuple[str, dict]] = {}
+    obj_by_name: dict[str, tuple[str, dict]] = {}
+    for slide in skeleton.get("slides", []):
+        slide_num: str = str(slide.get("slide_num", ""))
+        slide_by_num.setdefault(slide_num, slide)
+        for obj in slide.get("slide_objects", []):
+            obj_id: str = obj.get("object_id", "")
+            obj_name: str = obj.get("object_name", "")
+            if obj_id:
+                obj_by_slide_id.setdefault((slide_num, obj_id), (slide_num, obj))
+            if obj_name:
+                obj_by_slide_name.setdefault((slide_num, obj_name), (slide_num, obj))
+                obj_by_name.setdefault(obj_name, (slide_num, obj))
+    return {
+        "slide_by_num": slide_by_num,
+        "obj_by_slide_id": obj_by_slide_id,
+        "obj_by_slide_name": obj_by_slide_name,
+        "obj_by_name": obj_by_name,
+    }
+
+
+def get_skeleton_index() -> dict[str, dict]:
+    """Return lookup maps for the current skeleton, rebuilding them only when it changed."""
+    skeleton: Optional[dict] = deck_state["skeleton"]
+    cached: Optional[tuple[dict, dict]] = deck_state["skeleton_index_cache"]
+    if cached is not None and cached[0] is skeleton:
+        return cached[1]
+    index: dict[str, dict] = _build_skeleton_index(skeleton or {})
+    deck_state["skeleton_index_cache"] = (skeleton, index)
+    return index
+
 
 #  Slide selection helpers
 
 def get_slide_choices() -> list[str]:
-    """Return a list of slide label strings for the Gradio dropdown."""
+    """Return a list of slide label strings for the Gradio dropdown, built once per skeleton index."""
     if deck_state["skeleton"] is None:
         return []
-    choices: list[str] = []
-    for slide in deck_state["skeleton"].get("slides", []):
-        num = slide.get("slide_num", "?")
-        desc: str = slide.get("slide_description", "ללא תיאור")
-        choices.append(f"[שקף {num}] {desc}")
-    return choices
+    index: dict = get_skeleton_index()
+    choices: Optional[list[str]] = index.get("slide_choices")
+    if choices is None:
+        choices = [
+            f"[שקף {slide.get('slide_num', '?')}] {slide.get('slide_description', 'ללא תיאור')}"
+            for slide in deck_state["skeleton"].get("slides", [])
+        ]
+        index["slide_choices"] = choices
+    return list(choices)
 
 
 def parse_slide_num_from_selection(selection: str) -> Optional[str]:
     """Extract the slide number string from a '[שקף X] ...' dropdown value."""
-    match: Optional[re.Match] = re.match(r"\[שקף (.+?)\]", selection)
+    match: Optional[re.Match] = _SLIDE_RE.match(selection)
     return match.group(1) if match else None
 
 
@@ -39,24 +166,13 @@ def get_slide_by_num(slide_num: Optional[str]) -> Optional[dict]:
     """Look up a slide dict in the current skeleton by its slide_num."""
     if deck_state["skeleton"] is None or slide_num is None:
         return None
-    for slide in deck_state["skeleton"]["slides"]:
-        if str(slide.get("slide_num", "")) == slide_num:
-            return slide
-    return None
+    return get_skeleton_index()["slide_by_num"].get(str(slide_num))
 
 
 def detect_slide_count(user_prompt: str) -> Optional[int]:
     """Try to detect a requested slide count from the user prompt text."""
-    patterns: list[str] = [
-        r'(\d+)\s*שקפים',
-        r'(\d+)\s*שקף',
-        r'(\d+)\s*עמוד',
-        r'(\d+)\s*עמודים',
-        r'(\d+)\s*slides?',
-        r'מצגת\s*(?:של|בת|עם)\s*(\d+)',
-    ]
-    for pattern in patterns:
-        match: Optional[re.Match] = re.search(pattern, user_prompt)
+    for pattern in _SLIDE_COUNT_RES:
+        match: Optional[re.Match] = pattern.search(user_prompt)
         if match:
             return int(match.group(1))
     return None